@@ -1,8 +1,24 @@
 
+import importlib
+import logging
 import streamlit as st
-import cv_question
-import cv_short
-import cv_analyzer_search
+
+# logging
+logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# Page modules are imported only when their page is opened, so the sidebar renders
+# without loading the LLM, scraping and PDF libraries behind every page
+PAGES = {
+    "CV Shortlisting": ("cv_short", "create_cv_shortlisting_page"),
+    "Interview Questions": ("cv_question", "create_interview_questions_page"),
+    "CV Analyser + JobSearch": ("cv_analyzer_search", "Job_assistant"),
+}
+
+
+def load_page(page: str):
+    """Import the module behind a page (cached by Python after the first time) and return its render function."""
+    module_name, function_name = PAGES[page]
+    return getattr(importlib.import_module(module_name), function_name)
 
 
 def clear_session_state():
@@ -28,26 +44,13 @@ def main():
         # app_logger.info("Session state reset")
     
     # Navigation
-    page = st.sidebar.radio("Go to", ["CV Shortlisting", "Interview Questions","CV Analyser + JobSearch"])
+    page = st.sidebar.radio("Go to", list(PAGES))
     # app_logger.info(f"Page selected: {page}")
     
     try:
-        if page == "CV Shortlisting":
-            # app_logger.info("Navigating to CV Shortlisting")
-            cv_short.create_cv_shortlisting_page()
-            
-        elif page == "Interview Questions":
-            # Check if CV shortlisting is complete
-            # if not st.session_state.analysis_complete:
-            #     st.warning("Please complete the CV shortlisting process first.")
-            #     app_logger.warning("Attempted to access Interview Questions without completing CV shortlisting")
-            # else:
-                # app_logger.info("Navigating to Interview Questions")
-                cv_question.create_interview_questions_page()
-
-        elif page == "CV Analyser + JobSearch":
-            cv_analyzer_search.Job_assistant()
-                
+        # app_logger.info(f"Navigating to {page}")
+        load_page(page)()
+
     except Exception as e:
         # app_logger.error(f"Error occurred: {e}")
         st.error(f"An error occurred: {e}")
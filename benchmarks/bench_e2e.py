@@ -0,0 +1,176 @@
+"""
+        End-to-end throughput benchmark against a local fake Groq server
+
+        Generates a synthetic CV corpus, starts benchmarks/fake_groq.py in-process
+        and drives the real code paths through it:
+
+          extract     extract_cv_data on every CV, one after another
+          shortlist   CVAnalyzer.extract_batch + vectorized scoring (the shortlisting page loop)
+          suggest     JobSuggestionEngine.generate_job_suggestions
+          improve     ResumeImprovementEngine.generate_resume_improvement_suggestions (streaming)
+
+        Reports CVs (or calls) per second, p50/p95 latency per item and peak RSS.
+        No Groq key or network access is needed; the extraction cache is a fresh
+        temporary file so every run does the full work.
+
+        Run from the repository root:
+          python benchmarks/bench_e2e.py --count 100 --latency 0.3 --workers 8
+          python benchmarks/bench_e2e.py --scenarios shortlist --pack --no-fast-path
+"""
+
+import argparse
+import os
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from typing import Callable
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fake_groq import FakeGroqSettings, start_server
+from make_corpus import generate_corpus
+
+SCENARIOS = ["extract", "shortlist", "suggest", "improve"]
+REQUIREMENTS = {"min_years_experience": 5, "required_skills": ["Python", "SQL", "AWS", "Docker", "Kubernetes"]}
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def timed_calls(fn: Callable, items: list) -> tuple[float, list[float]]:
+    """Call fn on each item in turn; returns (wall seconds, per-item latencies)."""
+    latencies = []
+    start = time.perf_counter()
+    for item in items:
+        t = time.perf_counter()
+        fn(item)
+        latencies.append(time.perf_counter() - t)
+    return time.perf_counter() - start, latencies
+
+
+def report(name: str, unit: str, count: int, wall: float, latencies: list[float]):
+    print(
+        f"{name:<10} {count:5d} {unit:<6} {count / wall:8.2f} {unit}/s   "
+        f"p50 {percentile(latencies, 50) * 1000:8.1f} ms   p95 {percentile(latencies, 95) * 1000:8.1f} ms   "
+        f"peak RSS {peak_rss_mb():7.1f} MB"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=50, help="CVs in the synthetic corpus")
+    parser.add_argument("--pdf-ratio", type=float, default=0.5)
+    parser.add_argument("--max-pages", type=int, default=3)
+    parser.add_argument("--hard-ratio", type=float, default=0.3, help="Share of CVs that need the LLM")
+    parser.add_argument("--latency", type=float, default=0.3, help="Fake server seconds before the first token")
+    parser.add_argument("--tokens-per-second", type=float, default=500.0, help="Fake server generation speed")
+    parser.add_argument("--rpm", type=int, default=0, help="Fake server requests per minute before 429s")
+    parser.add_argument("--scheduler-rpm", type=int, default=None,
+                        help="Requests per minute the app's rate limiter paces to (default: --rpm, or unlimited)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fake server random 429 probability")
+    parser.add_argument("--small-miss-rate", type=float, default=0.2,
+                        help="Fake server probability that the small model leaves a field out (cascade escalations)")
+    parser.add_argument("--workers", type=int, default=4, help="CVAnalyzer max_workers for the shortlist scenario")
+    parser.add_argument("--pack", action="store_true", help="Pack CVs into shared requests in the shortlist scenario")
+    parser.add_argument("--no-fast-path", action="store_true", help="Send every CV to the LLM")
+    parser.add_argument("--calls", type=int, default=10, help="Calls for the suggest/improve scenarios")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="cv_bench_")
+    server = start_server(FakeGroqSettings(args.latency, args.tokens_per_second, args.rpm, args.error_rate, seed=1,
+                                               small_miss_rate=args.small_miss_rate))
+
+    # Must be set before the app modules are imported (cache path and fast path are read at import)
+    os.environ["GROQ_BASE_URL"] = server.url
+    os.environ["GROQ_API_KEY"] = "fake-key"
+    os.environ["CV_CACHE_PATH"] = os.path.join(workdir, "cache.sqlite3")
+    os.environ["CV_FAST_PATH"] = "0" if args.no_fast_path else "1"
+    # The fake server has no token limit; pace requests only, at its rpm unless told otherwise
+    scheduler_rpm = args.scheduler_rpm if args.scheduler_rpm is not None else args.rpm
+    limit = f"{scheduler_rpm}:0"
+    os.environ["GROQ_RATE_LIMITS"] = ",".join(
+        f"{model}={limit}" for model in ("llama-3.3-70b-versatile", "llama3-8b-8192", "*")
+    )
+
+    import logging
+    logging.disable(logging.WARNING)
+    import extraction as extr
+    import fast_extract
+    from cv_short import CVAnalyzer
+    from cv_analyzer_search import JobSuggestionEngine
+    from resume_advance_analysis import ResumeImprovementEngine
+
+    paths = generate_corpus(os.path.join(workdir, "corpus"), args.count, args.pdf_ratio, args.max_pages, args.hard_ratio)
+    print(f"{len(paths)} CVs, fake Groq at {server.url} "
+          f"(latency {args.latency}s, {args.tokens_per_second:g} tok/s, rpm {args.rpm or 'unlimited'})")
+
+    texts = [extr.process_file(extr.load_local_file(p)) for p in paths]
+
+    if "extract" in args.scenarios:
+        llm = extr.initialize_cascade()
+        wall, latencies = timed_calls(lambda text: extr.extract_cv_data(text, llm=llm, use_cache=False), texts)
+        report("extract", "CVs", len(texts), wall, latencies)
+
+    if "shortlist" in args.scenarios:
+        analyzer = CVAnalyzer(max_workers=args.workers)
+        latencies = []
+        extract_file = analyzer._extract_file
+
+        def timed_extract_file(uploaded_file):
+            t = time.perf_counter()
+            try:
+                return extract_file(uploaded_file)
+            finally:
+                latencies.append(time.perf_counter() - t)
+
+        analyzer._extract_file = timed_extract_file
+        uploads = [extr.load_local_file(p) for p in paths]
+        start = time.perf_counter()
+        results = analyzer.extract_batch(uploads, pack=args.pack)
+        candidates = [c.model_dump() for r in results for c in r.candidates]
+        analyzer.calculate_match_scores(candidates, REQUIREMENTS)
+        wall = time.perf_counter() - start
+        failed = sum(1 for r in results if r.error)
+        # Packed batches have no per-file timings; fall back to the batch average
+        report("shortlist", "CVs", len(uploads), wall, latencies or [wall / len(uploads)])
+        if failed:
+            print(f"           {failed} CV(s) failed: {next(r.error for r in results if r.error)}")
+
+    resumes = [extr.cv(**c) for c in (fast_extract.fast_extract(t).model_dump(exclude={"missing"}) for t in texts[:args.calls])]
+
+    if "suggest" in args.scenarios:
+        engine = JobSuggestionEngine()
+        wall, latencies = timed_calls(engine.generate_job_suggestions, resumes)
+        report("suggest", "calls", len(resumes), wall, latencies)
+
+    if "improve" in args.scenarios:
+        engine = ResumeImprovementEngine()
+        wall, latencies = timed_calls(
+            lambda text: engine.generate_resume_improvement_suggestions(text, on_token=lambda token: None),
+            texts[:args.calls],
+        )
+        report("improve", "calls", len(texts[:args.calls]), wall, latencies)
+
+    print(f"fake server: {server.requests} request(s), {server.rate_limited} answered with 429, "
+          f"fast path avoided {fast_extract.stats.llm_calls_avoided} LLM call(s)")
+    if extr.cascade_stats.as_dict():
+        print(f"model cascade: {extr.cascade_stats.summary()}")
+    server.shutdown()
+    shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+        Micro-benchmark: TF-IDF ranking of scraped postings against a resume
+
+        Run from the repository root:  python benchmarks/bench_job_ranking.py [n_postings]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+from job_ranking import JobIndex
+
+WORDS = [
+    "python", "java", "react", "aws", "docker", "kubernetes", "sql", "node.js", "c++", "ci/cd",
+    "sales", "marketing", "design", "team", "customers", "growth", "experience", "build", "services",
+] + [f"term{i}" for i in range(2000)]
+TITLES = ["Software Engineer", "Data Analyst", "Product Manager", "DevOps Engineer", "Sales Executive"]
+
+
+def make_postings(n: int, words_per_posting: int = 300, seed: int = 7) -> pd.DataFrame:
+    rng = random.Random(seed)
+    return pd.DataFrame({
+        "site": [rng.choice(["indeed", "linkedin"]) for _ in range(n)],
+        "title": [rng.choice(TITLES) for _ in range(n)],
+        "description": [" ".join(rng.choices(WORDS, k=words_per_posting)) for _ in range(n)],
+    })
+
+
+def main(n: int = 5_000):
+    jobs = make_postings(n)
+    skills, certifications = ["Python", "AWS", "Docker", "SQL"], ["AWS Certified Developer"]
+
+    start = time.perf_counter()
+    index = JobIndex(jobs)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    ranked = index.rank(skills, certifications, top_k=50)
+    rank_time = time.perf_counter() - start
+
+    assert ranked["match_score"].is_monotonic_decreasing
+
+    print(f"{n} postings")
+    print(f"  build index : {build_time * 1000:8.1f} ms  (once per result set)")
+    print(f"  rank top 50 : {rank_time * 1000:8.1f} ms  (per resume)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5_000)
@@ -0,0 +1,58 @@
+"""
+        Micro-benchmark: scalar CVAnalyzer.calculate_match_score loop vs the vectorized scorer
+
+        Run from the repository root:  python benchmarks/bench_scoring.py [n_candidates]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from cv_short import CVAnalyzer
+from scoring import score_candidates
+
+SKILLS = [f"skill_{i}" for i in range(500)] + ["Python", "SQL", "AWS", "Docker", "Kubernetes", "React"]
+
+
+def make_candidates(n: int, seed: int = 7) -> list[dict]:
+    rng = random.Random(seed)
+    return [
+        {
+            "name": f"Candidate {i}",
+            "skills": rng.sample(SKILLS, rng.randint(3, 25)),
+            "certifications": [],
+            "years_of_exp": rng.randint(0, 20),
+        }
+        for i in range(n)
+    ]
+
+
+def main(n: int = 10_000):
+    candidates = make_candidates(n)
+    requirements = {"min_years_experience": 5, "required_skills": ["python", "sql", "aws", "docker", "skill_3"]}
+
+    # calculate_match_score does not touch the LLM, so skip building one
+    analyzer = CVAnalyzer.__new__(CVAnalyzer)
+
+    start = time.perf_counter()
+    scalar = [analyzer.calculate_match_score(c, requirements) for c in candidates]
+    scalar_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    vectorized = score_candidates(candidates, requirements)
+    vector_time = time.perf_counter() - start
+
+    for key in ("skills_match", "experience_match", "overall_score"):
+        assert np.array_equal(np.array([s[key] for s in scalar]), vectorized[key]), key
+
+    print(f"{n} candidates")
+    print(f"  scalar loop : {scalar_time * 1000:8.1f} ms")
+    print(f"  vectorized  : {vector_time * 1000:8.1f} ms  ({scalar_time / vector_time:.1f}x faster, identical scores)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
@@ -0,0 +1,77 @@
+"""
+        Startup benchmark: cold import of app.py and first render of each page
+
+        Every measurement runs in a fresh interpreter so nothing is already imported.
+        Exits non-zero when the cold import of app.py is over the budget.
+
+        Run from the repository root:  python benchmarks/bench_startup.py [--runs 3] [--budget 0.5]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+COLD_IMPORT = """
+import time
+start = time.perf_counter()
+import app
+print(time.perf_counter() - start)
+"""
+
+# First script run (sidebar + default page), then the time to open `page` for the first time
+FIRST_RENDER = """
+import json, logging, sys, time
+logging.disable(logging.CRITICAL)
+from streamlit.testing.v1 import AppTest
+page = sys.argv[1]
+start = time.perf_counter()
+at = AppTest.from_file("app.py", default_timeout=120).run()
+first = time.perf_counter() - start
+start = time.perf_counter()
+if at.sidebar.radio[0].value != page:
+    at.sidebar.radio[0].set_value(page).run()
+print(json.dumps({"first": first, "open": time.perf_counter() - start,
+                  "errors": [e.value for e in at.exception]}))
+"""
+
+
+def run_child(code: str, *args: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", code, *args], cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    return result.stdout.strip().splitlines()[-1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=3, help="Fresh interpreters per measurement (median is reported)")
+    parser.add_argument("--budget", type=float, default=0.5, help="Maximum seconds for a cold 'import app'")
+    args = parser.parse_args()
+
+    from app import PAGES
+
+    cold = statistics.median(float(run_child(COLD_IMPORT)) for _ in range(args.runs))
+    print(f"cold import app.py : {cold * 1000:8.0f} ms  (budget {args.budget * 1000:.0f} ms)")
+
+    for i, page in enumerate(PAGES):
+        samples = [json.loads(run_child(FIRST_RENDER, page)) for _ in range(args.runs)]
+        for error in {e for sample in samples for e in sample["errors"]}:
+            print(f"  {page}: {error}")
+        if i == 0:
+            print(f"first render (sidebar + {page}) : {statistics.median(s['first'] for s in samples) * 1000:8.0f} ms")
+        else:
+            print(f"first open of {page:<24}: {statistics.median(s['open'] for s in samples) * 1000:8.0f} ms")
+
+    if cold > args.budget:
+        print("cold import is over budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,294 @@
+"""
+        Local stand-in for the Groq (OpenAI-compatible) chat completions API
+
+        Answers POST /openai/v1/chat/completions with plausible output for every
+        prompt in the app: structured CV extraction (tool calls, single and packed),
+        job suggestion and resume improvement JSON, and interview questions, with
+        or without streaming. Latency, token rate and rate limiting are configurable
+        so benchmarks can run offline with realistic timing.
+
+        python benchmarks/fake_groq.py --port 8765 --latency 0.4 --tokens-per-second 300 --rpm 30
+        GROQ_BASE_URL=http://127.0.0.1:8765 GROQ_API_KEY=fake streamlit run app.py
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from compaction import count_tokens
+from fast_extract import fast_extract
+
+PACKED_CV_RE = re.compile(r"^### CV (\d+)\s*$", re.MULTILINE)
+YEARS_RE = re.compile(r"(\d+)\+?\s+years", re.IGNORECASE)
+
+
+class FakeGroqSettings:
+    """
+        Behaviour of the fake server.
+
+        latency            seconds before the first token
+        tokens_per_second  generation speed after the first token (0 = instant)
+        rpm                requests accepted per rolling minute before answering 429 (0 = unlimited)
+        error_rate         probability of a random 429 on any request
+        retry_after        seconds sent in the retry-after header of a random 429
+        small_miss_rate    probability that a small ("8b") model leaves years_of_exp out of a CV
+    """
+
+    def __init__(self, latency: float = 0.3, tokens_per_second: float = 0.0, rpm: int = 0,
+                 error_rate: float = 0.0, retry_after: float = 1.0, seed: Optional[int] = None,
+                 small_miss_rate: float = 0.0):
+        self.latency = latency
+        self.tokens_per_second = tokens_per_second
+        self.rpm = rpm
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+        self.small_miss_rate = small_miss_rate
+        self.random = random.Random(seed)
+
+
+def is_small_model(model: str) -> bool:
+    return "8b" in model
+
+
+def listed_skills(text: str) -> list[str]:
+    """The comma separated line under a "Skills" heading, as a model would read it."""
+    lines = [line.strip() for line in text.splitlines()]
+    for heading, line in zip(lines, lines[1:]):
+        if heading.lower() == "skills":
+            return [skill.strip() for skill in line.split(",") if skill.strip()]
+    return []
+
+
+def fake_candidate(text: str, miss: bool = False) -> dict:
+    """
+        A cv-shaped answer built from what is actually in the text, like a good model would.
+
+        With `miss` the years of experience are left out, as a small model
+        sometimes does, so the extraction cascade has something to escalate.
+    """
+    found = fast_extract(text)
+    years = found.years_of_exp
+    if years is None:
+        # Ambiguous figures: settle on the first one, like most models do
+        match = YEARS_RE.search(text)
+        years = int(match.group(1)) if match else 3
+    if miss:
+        years = None
+    return {
+        "name": found.name or text.strip().splitlines()[0][:40] if text.strip() else None,
+        "skills": found.skills or listed_skills(text),
+        "certifications": found.certifications or [],
+        "years_of_exp": years,
+    }
+
+
+def tool_call_arguments(tool_name: str, text: str, miss: Callable[[], bool] = lambda: False) -> dict:
+    if tool_name == "packed_data":
+        parts = PACKED_CV_RE.split(text)[1:]
+        return {"candidates": [
+            {**fake_candidate(body, miss()), "source_cv": int(number)}
+            for number, body in zip(parts[0::2], parts[1::2])
+        ]}
+    return {"candidates": [fake_candidate(text, miss())]}
+
+
+def text_answer(system: str) -> str:
+    if "career advisor" in system:
+        return json.dumps({"job_suggestions": [
+            {"role": role, "description": f"Build and run {role.lower()} work.", "suitability_reason": "Matches the listed skills."}
+            for role in ("Software Engineer", "Data Engineer", "Backend Developer", "Platform Engineer", "ML Engineer")
+        ]})
+    if "resume consultant" in system:
+        return json.dumps({
+            "overall_assessment": {"strengths": ["Clear skills section"], "weaknesses": ["Few measurable results"]},
+            "section_recommendations": {
+                "work_experience": {"current_status": "Solid", "improvement_suggestions": ["Quantify impact"]},
+                "education": {"current_status": "Complete", "improvement_suggestions": ["Add relevant coursework"]},
+            },
+            "writing_improvements": {"language_suggestions": ["Use active verbs"], "formatting_advice": ["Keep to two pages"]},
+            "additional_sections_recommended": ["Projects"],
+            "keyword_optimization": {"missing_industry_keywords": ["CI/CD"], "ats_compatibility_score": "7/10"},
+            "career_positioning": {"personal_branding_suggestions": ["Add a summary"],
+                                   "skill_highlighting_recommendations": ["Lead with core skills"]},
+        })
+    return "\n\n".join(
+        f"**Question {n}:**\n\n- Technical_question: \"Explain a design decision from your last project.\"\n\n"
+        f"- Follow_up_question: \"What would you change now?\"\n\n- What_to_listen_for: \"Trade-offs and ownership.\""
+        for n in range(1, 6)
+    )
+
+
+class FakeGroqServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], settings: FakeGroqSettings):
+        super().__init__(address, _Handler)
+        self.settings = settings
+        self.requests = 0
+        self.rate_limited = 0
+        self._recent: deque[float] = deque()
+        self._lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.server_address[0]}:{self.server_address[1]}"
+
+    def admit(self) -> Optional[float]:
+        """None when the request may proceed, else the retry-after seconds for a 429."""
+        now = time.monotonic()
+        with self._lock:
+            self.requests += 1
+            if self.settings.error_rate and self.settings.random.random() < self.settings.error_rate:
+                self.rate_limited += 1
+                return self.settings.retry_after
+            if self.settings.rpm:
+                while self._recent and now - self._recent[0] >= 60:
+                    self._recent.popleft()
+                if len(self._recent) >= self.settings.rpm:
+                    self.rate_limited += 1
+                    return max(0.0, 60 - (now - self._recent[0]))
+                self._recent.append(now)
+        return None
+
+    def small_model_miss(self, model: str) -> bool:
+        """Whether this answer from `model` should leave a field out (small models only)."""
+        if not is_small_model(model) or not self.settings.small_miss_rate:
+            return False
+        with self._lock:
+            return self.settings.random.random() < self.settings.small_miss_rate
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: FakeGroqServer
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        if not self.path.endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": "not found"}})
+            return
+
+        retry_after = self.server.admit()
+        if retry_after is not None:
+            self._send_json(429, {"error": {"message": "Rate limit reached", "type": "tokens", "code": "rate_limit_exceeded"}},
+                            headers={"retry-after": f"{retry_after:.2f}"})
+            return
+
+        messages = body.get("messages", [])
+        system = " ".join(m.get("content") or "" for m in messages if m.get("role") == "system")
+        user = "\n".join(m.get("content") or "" for m in messages if m.get("role") == "user")
+        prompt_tokens = count_tokens(system + user)
+
+        tools = body.get("tools") or []
+        if tools:
+            name = tools[0]["function"]["name"]
+            message = {"role": "assistant", "content": None, "tool_calls": [{
+                "id": f"call_{uuid.uuid4().hex[:12]}", "type": "function",
+                "function": {"name": name, "arguments": json.dumps(tool_call_arguments(
+                    name, user, lambda: self.server.small_model_miss(body.get("model", ""))))},
+            }]}
+            content, finish_reason = message["tool_calls"][0]["function"]["arguments"], "tool_calls"
+        else:
+            content = text_answer(system)
+            message, finish_reason = {"role": "assistant", "content": content}, "stop"
+        completion_tokens = count_tokens(content)
+
+        time.sleep(self.server.settings.latency)
+        if body.get("stream"):
+            self._stream(body.get("model", ""), content, finish_reason)
+            return
+
+        if self.server.settings.tokens_per_second:
+            time.sleep(completion_tokens / self.server.settings.tokens_per_second)
+        self._send_json(200, {
+            "id": f"chatcmpl-{uuid.uuid4().hex}", "object": "chat.completion", "created": int(time.time()),
+            "model": body.get("model", ""),
+            "choices": [{"index": 0, "message": message, "logprobs": None, "finish_reason": finish_reason}],
+            "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+                      "total_tokens": prompt_tokens + completion_tokens},
+        })
+
+    def _stream(self, model: str, content: str, finish_reason: str):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+        pieces = re.findall(r"\S+\s*|\s+", content)
+        rate = self.server.settings.tokens_per_second
+        for i, piece in enumerate(pieces + [None]):
+            delta = {"content": piece} if piece is not None else {}
+            if i == 0:
+                delta["role"] = "assistant"
+            chunk = {
+                "id": completion_id, "object": "chat.completion.chunk", "created": int(time.time()), "model": model,
+                "choices": [{"index": 0, "delta": delta, "logprobs": None,
+                             "finish_reason": finish_reason if piece is None else None}],
+            }
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+            self.wfile.flush()
+            if rate and piece is not None:
+                time.sleep(count_tokens(piece) / rate)
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+
+    def _send_json(self, status: int, payload: dict, headers: Optional[dict] = None):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server(settings: FakeGroqSettings, host: str = "127.0.0.1", port: int = 0) -> FakeGroqServer:
+    """Start the fake server on a background thread (port 0 picks a free port)."""
+    server = FakeGroqServer((host, port), settings)
+    threading.Thread(target=server.serve_forever, name="fake-groq", daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.3, help="Seconds before the first token")
+    parser.add_argument("--tokens-per-second", type=float, default=0.0, help="Generation speed (0 = instant)")
+    parser.add_argument("--rpm", type=int, default=0, help="Requests per minute before 429s (0 = unlimited)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Probability of a random 429")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="retry-after seconds for random 429s")
+    parser.add_argument("--small-miss-rate", type=float, default=0.0,
+                        help="Probability that a small model leaves years_of_exp out of a CV")
+    args = parser.parse_args()
+
+    settings = FakeGroqSettings(args.latency, args.tokens_per_second, args.rpm, args.error_rate, args.retry_after,
+                                small_miss_rate=args.small_miss_rate)
+    server = FakeGroqServer((args.host, args.port), settings)
+    print(f"Fake Groq API on {server.url}  (set GROQ_BASE_URL to this)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+        Synthetic CV corpus generator (PDF and TXT)
+
+        Writes CVs of varying length to a directory. A share of them is "hard":
+        few dictionary skills and conflicting experience figures, so the
+        deterministic fast path cannot settle them and an LLM call is needed.
+
+        python benchmarks/make_corpus.py /tmp/cv_corpus --count 200 --pdf-ratio 0.5 --max-pages 3
+"""
+
+import argparse
+import os
+import random
+
+FIRST_NAMES = ["Ava", "Liam", "Maya", "Noah", "Zara", "Omar", "Lena", "Ravi", "Chloe", "Mateo", "Ines", "Kenji"]
+LAST_NAMES = ["Patel", "Garcia", "Nguyen", "Smith", "Okafor", "Rossi", "Kowalski", "Haddad", "Larsen", "Moreau"]
+SKILLS = [
+    "Python", "Java", "TypeScript", "Go", "SQL", "PostgreSQL", "MongoDB", "Redis", "React", "Node.js",
+    "Django", "FastAPI", "Docker", "Kubernetes", "Terraform", "AWS", "Azure", "GCP", "Kafka", "Spark",
+    "Airflow", "Pandas", "PyTorch", "TensorFlow", "Machine Learning", "Git", "Linux", "GraphQL",
+]
+CERTIFICATIONS = ["AWS Certified Solutions Architect", "Certified Kubernetes Administrator", "Terraform Associate", "PMP"]
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella Labs", "Hooli", "Stark Industries", "Wayne Tech"]
+DUTIES = [
+    "Designed and maintained services handling millions of requests per day",
+    "Led migration of legacy batch jobs to an event-driven pipeline",
+    "Mentored junior engineers and ran code reviews for the team",
+    "Cut infrastructure cost by a third through rightsizing and caching",
+    "Built dashboards and alerting for service level objectives",
+    "Worked with product managers to scope and ship quarterly roadmap items",
+]
+LINES_PER_PAGE = 45
+
+
+def make_cv_text(rng: random.Random, pages: int, hard: bool) -> str:
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    years = rng.randint(1, 20)
+    skills = rng.sample(SKILLS, 2 if hard else rng.randint(4, 10))
+    lines = [name, f"{name.split()[0].lower()}@example.com | +1 555 0100", ""]
+    if hard:
+        # Two different figures: too ambiguous for the fast path
+        lines += ["Summary", f"Engineer with {years} years of experience, {years + 2} years of experience in total industry work.", ""]
+    else:
+        lines += ["Summary", f"Engineer with {years} years of experience building production systems.", ""]
+    lines += ["Skills", ", ".join(skills), ""]
+    if rng.random() < 0.4:
+        lines += ["Certifications", rng.choice(CERTIFICATIONS), ""]
+    lines += ["Experience"]
+
+    while len(lines) < pages * LINES_PER_PAGE:
+        lines += [f"{rng.choice(COMPANIES)} - Software Engineer ({rng.randint(2005, 2023)})"]
+        lines += [f"- {duty}" for duty in rng.sample(DUTIES, 3)]
+        lines += [""]
+    return "\n".join(lines[:pages * LINES_PER_PAGE])
+
+
+def _pdf_escape(line: str) -> str:
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def make_pdf(text: str) -> bytes:
+    """Minimal text-only PDF (Helvetica, one page per LINES_PER_PAGE lines); no extra dependencies."""
+    lines = text.split("\n")
+    pages = [lines[i:i + LINES_PER_PAGE] for i in range(0, len(lines), LINES_PER_PAGE)] or [[]]
+    font_id = 3 + 2 * len(pages)
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{' '.join(f'{3 + 2 * i} 0 R' for i in range(len(pages)))}] /Count {len(pages)} >>",
+    ]
+    for i, page_lines in enumerate(pages):
+        stream = "BT /F1 10 Tf 50 760 Td 15 TL " + " ".join(f"({_pdf_escape(line)}) '" for line in page_lines) + " ET"
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 {font_id} 0 R >> >> /Contents {4 + 2 * i} 0 R >>"
+        )
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+    objects.append("<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for number, obj in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{obj}\nendobj\n".encode("latin-1")
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("latin-1")
+    out += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode("latin-1")
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode("latin-1")
+    return out
+
+
+def generate_corpus(directory: str, count: int, pdf_ratio: float = 0.5, max_pages: int = 3,
+                    hard_ratio: float = 0.3, seed: int = 7) -> list[str]:
+    """Write `count` CVs to `directory` and return their paths."""
+    rng = random.Random(seed)
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for i in range(count):
+        text = make_cv_text(rng, pages=rng.randint(1, max_pages), hard=rng.random() < hard_ratio)
+        if rng.random() < pdf_ratio:
+            path = os.path.join(directory, f"cv_{i:05d}.pdf")
+            with open(path, "wb") as f:
+                f.write(make_pdf(text))
+        else:
+            path = os.path.join(directory, f"cv_{i:05d}.txt")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+        paths.append(path)
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("directory")
+    parser.add_argument("--count", type=int, default=100)
+    parser.add_argument("--pdf-ratio", type=float, default=0.5)
+    parser.add_argument("--max-pages", type=int, default=3)
+    parser.add_argument("--hard-ratio", type=float, default=0.3, help="Share of CVs the fast path cannot settle")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    paths = generate_corpus(args.directory, args.count, args.pdf_ratio, args.max_pages, args.hard_ratio, args.seed)
+    print(f"Wrote {len(paths)} CVs to {args.directory}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+import os
+import re
+from collections import Counter
+from typing import Iterable
+from fast_extract import SECTION_HEADER_RE
+
+# Upper bound on resume tokens sent to the LLM (overridable through the environment)
+DEFAULT_TOKEN_BUDGET = int(os.getenv("CV_TOKEN_BUDGET", "3000"))
+
+# Lines that carry no information for extraction or analysis
+BOILERPLATE_RE = re.compile(
+    r"^\s*(page\s*\d+(\s*(of|/)\s*\d+)?|\d+\s*/\s*\d+|curriculum vitae|résumé|resume|"
+    r"references (are )?available (up)?on request\.?|[-_=*•.]{3,})\s*$",
+    re.IGNORECASE,
+)
+
+# Sections dropped first when a resume is over budget, least useful first
+LOW_PRIORITY_SECTIONS = ["references", "hobbies", "interests", "volunteering", "publications", "awards", "languages"]
+
+# Lines at the top/bottom of a page that are checked for running headers and footers
+EDGE_LINES = 3
+
+
+def count_tokens(text: str) -> int:
+    """Approximate LLM token count: one per word or punctuation mark, plus one per 8 extra letters."""
+    return sum(1 + len(piece) // 8 for piece in re.findall(r"\w+|[^\w\s]", text))
+
+
+def collapse_whitespace(text: str) -> str:
+    text = re.sub(r"[ \t\f\v\u00a0]+", " ", text)
+    text = "\n".join(line.strip() for line in text.splitlines())
+    return re.sub(r"\n{3,}", "\n\n", text).strip()
+
+
+def strip_running_lines(pages: list[str]) -> list[str]:
+    """Remove header/footer lines repeated at the edges of most pages (kept on the first page)."""
+    if len(pages) < 2:
+        return pages
+
+    def edges(lines: list[str]) -> set[str]:
+        return {re.sub(r"\d+", "#", line) for line in lines[:EDGE_LINES] + lines[-EDGE_LINES:] if line}
+
+    page_lines = [page.splitlines() for page in pages]
+    counts = Counter(key for lines in page_lines for key in edges(lines))
+    running = {key for key, n in counts.items() if n >= max(2, len(pages) // 2 + 1)}
+
+    cleaned = [pages[0]]
+    for lines in page_lines[1:]:
+        edge_idx = set(range(min(EDGE_LINES, len(lines)))) | set(range(max(0, len(lines) - EDGE_LINES), len(lines)))
+        cleaned.append("\n".join(
+            line for i, line in enumerate(lines)
+            if not (i in edge_idx and re.sub(r"\d+", "#", line) in running)
+        ))
+    return cleaned
+
+
+def split_sections(text: str) -> list[tuple[str, str]]:
+    """Split text into (header, body) pairs on known resume section headers; the preamble has header ''."""
+    sections: list[tuple[str, list[str]]] = [("", [])]
+    for line in text.splitlines():
+        if SECTION_HEADER_RE.match(line):
+            sections.append((line.strip(), []))
+        else:
+            sections[-1][1].append(line)
+    return [(header, "\n".join(body).strip()) for header, body in sections if header or body]
+
+
+def trim_to_budget(sections: list[tuple[str, str]], token_budget: int) -> list[tuple[str, str]]:
+    """Drop low-priority sections, then shorten the longest bodies, until the text fits the budget."""
+    def total(parts):
+        return sum(count_tokens(header) + count_tokens(body) for header, body in parts)
+
+    sections = list(sections)
+    for name in LOW_PRIORITY_SECTIONS:
+        if total(sections) <= token_budget:
+            return sections
+        sections = [(h, b) for h, b in sections if not h.lower().rstrip(":").strip().endswith(name)]
+
+    while total(sections) > token_budget:
+        # Cut the longest section back by whole lines, keeping its opening lines
+        longest = max(range(len(sections)), key=lambda i: count_tokens(sections[i][1]))
+        header, body = sections[longest]
+        lines = body.splitlines()
+        if len(lines) <= 1:
+            words = body.split()
+            keep = max(0, len(words) - max(1, (total(sections) - token_budget)))
+            sections[longest] = (header, " ".join(words[:keep]))
+            if not keep:
+                break
+        else:
+            sections[longest] = (header, "\n".join(lines[:max(1, len(lines) * 3 // 4)]))
+    return sections
+
+
+def compact_pages(pages: Iterable[str], token_budget: int = DEFAULT_TOKEN_BUDGET) -> str:
+    """
+        Turn raw page texts into a compact resume text within token_budget.
+
+        Collapses whitespace, removes running headers/footers and boilerplate
+        lines, then trims section by section if the result is still too long.
+    """
+    pages = strip_running_lines([collapse_whitespace(page) for page in pages])
+    text = "\n".join(
+        line for page in pages for line in page.splitlines()
+        if not BOILERPLATE_RE.match(line)
+    )
+    text = collapse_whitespace(text)
+
+    if count_tokens(text) <= token_budget:
+        return text
+
+    sections = trim_to_budget(split_sections(text), token_budget)
+    return "\n".join(f"{header}\n{body}" if header else body for header, body in sections).strip()
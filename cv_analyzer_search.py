@@ -1,31 +1,28 @@
 import streamlit as st
 import pandas as pd
-from groq import Groq
-from jobspy import scrape_jobs
+from llm_clients import get_groq_client, get_groq_api_key
+import metrics
+import rate_limiter
+from compaction import count_tokens
+from job_search import search_jobs, search_jobs_by_site, describe_cache_status
+from result_viewer import render_result_table
 from resume_advance_analysis import *
 from extraction import *
+from cv_cache import content_hash
 from typing import List, Dict, Any
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from stages import StageExecutor
 import json
 import re
 import os
+import queue
+import threading
 import logging
 
 
-def make_clickable_link(link):
-    return f'<a href="{link}" target="_blank">{link}</a>'
 
-
-
-# os.environ['GROQ_API_KEY'] = os.getenv("GROQ_API_KEY")
-groq_api_key = os.getenv("GROQ_API_KEY")
-if groq_api_key is None:
-        try:
-            groq_api_key = st.secrets["GROQ_API_KEY"]
-        except Exception as e:
-            st.error("GROQ_API_KEY is not set in the environment variables or Streamlit secrets.")
-            groq_api_key = None
-
-# groq_api_key = st.secrets["GROQ_API_KEY"]
+# Ranked job results keep only the best matches; more than this is rarely paged through
+RANKED_JOBS = 500
 
 # Configure logging
 # logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -40,24 +37,18 @@ class JobSuggestionEngine:
         #     temperature=0.7,
         #     max_tokens=4096
         # )
-        self.client = Groq(api_key=groq_api_key)
+        self.client = get_groq_client(get_groq_api_key())
     
     def _extract_json(self, text: str) -> Dict[str, Any]:
         """
                 Extracting JSON from LLM
         """
-        try:
-            # logger.debug("Extracting JSON from LLM response")
-            # Clean and extract JSON
-            json_match = re.search(r'\{.*\}', text, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group(0))
-            return {}
-        
-        except Exception as e:
-            st.error(f"JSON Extraction Error: {e}")
-            # logger.error(f"JSON Extraction Error: {e}")
-            return {}
+        # logger.debug("Extracting JSON from LLM response")
+        # Clean and extract JSON
+        json_match = re.search(r'\{.*\}', text, re.DOTALL)
+        if json_match:
+            return json.loads(json_match.group(0))
+        return {}
     
     def generate_job_suggestions(self, resume_data: cv) -> List[Dict[str, str]]:
 
@@ -88,41 +79,136 @@ class JobSuggestionEngine:
 
 
             """
-        try:
 
-            # logger.debug(f"Calling Groq API with prompt: {prompt[:100]}...") # start of api call
-            
-            # API call to the Groq client for chat completions
-            chat_completion = self.client.chat.completions.create(
-                messages=[
-                    {"role": "system", "content": "You are a career advisor generating job suggestions based on resume details."},
-                    {"role": "user", "content": prompt}
-                ],
-                model="llama3-8b-8192",  
-                temperature=0.7,  
-                max_tokens=1024, 
-                top_p=1,
-                stop=None,
-                stream=False
+        # logger.debug(f"Calling Groq API with prompt: {prompt[:100]}...") # start of api call
+        
+        # API call to the Groq client for chat completions
+        with metrics.span("llm", model="llama3-8b-8192"):
+            chat_completion = rate_limiter.call(
+                "llama3-8b-8192",
+                lambda: self.client.chat.completions.create(
+                    messages=[
+                        {"role": "system", "content": "You are a career advisor generating job suggestions based on resume details."},
+                        {"role": "user", "content": prompt}
+                    ],
+                    model="llama3-8b-8192",  
+                    temperature=0.7,  
+                    max_tokens=1024, 
+                    top_p=1,
+                    stop=None,
+                    stream=False
+                ),
+                tokens=count_tokens(prompt) + 400,  # three short suggestions
             )
-            
-            # Extract and parse the JSON response from the completion
-            response_text = chat_completion.choices[0].message.content
+        
+        # Extract and parse the JSON response from the completion
+        response_text = chat_completion.choices[0].message.content
+        with metrics.span("json_parse"):
             suggestions_data = self._extract_json(response_text)
 
-            # logger.info(f"Job suggestions generated: {len(suggestions_data.get('job_suggestions', []))} found")
-            
-            # Return job suggestions, if not found -> empty list 
-            return suggestions_data.get('job_suggestions', [])
+        # logger.info(f"Job suggestions generated: {len(suggestions_data.get('job_suggestions', []))} found")
         
-        except Exception as e:
-            st.error(f"Job Suggestion Error: {e}")
-            # logger.error(f"Job Suggestion Error: {e}")
-            return []
+        # Return job suggestions, if not found -> empty list 
+        return suggestions_data.get('job_suggestions', [])
+
+def rank_search_results(jobs: pd.DataFrame, search_params: dict, resume: cv) -> pd.DataFrame:
+    """
+        Top RANKED_JOBS postings by match with the resume.
+
+        The TF-IDF index is kept in session state for the search it was built
+        from (its parameters and posting URLs), so repeating a search or
+        ranking it for another resume does not tokenize every posting again.
+    """
+    # scikit-learn is only needed once there are results to rank
+    from job_ranking import JobIndex
+
+    urls = jobs["job_url"] if "job_url" in jobs else jobs.index.to_series()
+    key = (repr(sorted(search_params.items())), int(pd.util.hash_pandas_object(urls, index=False).sum()))
+    cached = st.session_state.get("job_index")
+    if cached is None or cached[0] != key:
+        cached = st.session_state.job_index = (key, JobIndex(jobs))
+    return cached[1].rank(resume.skills, resume.certifications, top_k=RANKED_JOBS)
+
+@metrics.timed("render", view="job_suggestions")
+def render_job_suggestions(job_suggestions: List[Dict[str, str]]):
+    """Render the job suggestion expanders."""
+    st.header("🎯 Job Suggestions")
+    for suggestion in job_suggestions:
+        with st.expander(f"{suggestion.get('role', 'Unnamed Role')}"):
+            st.write(f"**Description:** {suggestion.get('description', 'No description')}")
+            st.write(f"**Suitability:** {suggestion.get('suitability_reason', 'Not specified')}")
+
+@metrics.timed("render", view="improvement_suggestions")
+def render_improvement_suggestions(improvement_suggestions: Dict[str, Any]):
+    """Render the structured resume improvement analysis."""
+    # Overall Assessment
+    if improvement_suggestions.get('overall_assessment'):
+        with st.expander("📊 Overall Assessment"):
+            st.write("**Strengths:**")
+            for strength in improvement_suggestions['overall_assessment'].get('strengths', []):
+                st.markdown(f"- {strength}")
+
+            st.write("**Weaknesses:**")
+            for weakness in improvement_suggestions['overall_assessment'].get('weaknesses', []):
+                st.markdown(f"- {weakness}")
+
+    # Section Recommendations
+    if improvement_suggestions.get('section_recommendations'):
+        with st.expander("📝 Section-by-Section Recommendations"):
+            for section, details in improvement_suggestions['section_recommendations'].items():
+                st.subheader(f"{section.replace('_', ' ').title()} Section")
+                st.write(f"**Current Status:** {details.get('current_status', 'No assessment')}")
+
+                st.write("**Improvement Suggestions:**")
+                for suggestion in details.get('improvement_suggestions', []):
+                    st.markdown(f"- {suggestion}")
+
+    # Additional Insights
+    st.subheader("✨ Additional Recommendations")
+
+    # Writing Improvements
+    if improvement_suggestions.get('writing_improvements'):
+        with st.expander("✍️ Writing & Formatting Advice"):
+            st.write("**Language Suggestions:**")
+            for lang_suggestion in improvement_suggestions['writing_improvements'].get('language_suggestions', []):
+                st.markdown(f"- {lang_suggestion}")
+
+            st.write("**Formatting Advice:**")
+            for format_advice in improvement_suggestions['writing_improvements'].get('formatting_advice', []):
+                st.markdown(f"- {format_advice}")
+
+    # Additional Sections
+    if improvement_suggestions.get('additional_sections_recommended'):
+        with st.expander("📋 Suggested Additional Sections"):
+            for section in improvement_suggestions['additional_sections_recommended']:
+                st.markdown(f"- {section}")
+
+    # Keyword Optimization
+    if improvement_suggestions.get('keyword_optimization'):
+        with st.expander("🔑 Keyword & ATS Optimization"):
+            st.write("**Missing Industry Keywords:**")
+            for keyword in improvement_suggestions['keyword_optimization'].get('missing_industry_keywords', []):
+                st.markdown(f"- {keyword}")
+
+            st.write(f"**ATS Compatibility Score:** {improvement_suggestions['keyword_optimization'].get('ats_compatibility_score', 'Not available')}")
+
+    # Career Positioning
+    if improvement_suggestions.get('career_positioning'):
+        with st.expander("🎯 Career Positioning"):
+            st.write("**Personal Branding Suggestions:**")
+            for branding_suggestion in improvement_suggestions['career_positioning'].get('personal_branding_suggestions', []):
+                st.markdown(f"- {branding_suggestion}")
+
+            st.write("**Skill Highlighting Recommendations:**")
+            for skill_suggestion in improvement_suggestions['career_positioning'].get('skill_highlighting_recommendations', []):
+                st.markdown(f"- {skill_suggestion}")
 
 def Job_assistant():
     st.title("📄 Job Suggestion & Search Assistant")
 
+    if get_groq_api_key() is None:
+        st.error("GROQ_API_KEY is not set in the environment variables or Streamlit secrets.")
+
     # Initialize session state for resume analysis tab
     if 'uploaded_resume' not in st.session_state:
         st.session_state.uploaded_resume = None
@@ -132,6 +218,10 @@ def Job_assistant():
         st.session_state.job_suggestions = []
     if 'improvement_suggestions' not in st.session_state:
         st.session_state.improvement_suggestions = {}
+    if 'resume_hash' not in st.session_state:
+        st.session_state.resume_hash = None
+    if 'resume_candidates' not in st.session_state:
+        st.session_state.resume_candidates = []
     
     # Initialize session state for job search tab
     if 'site_name' not in st.session_state:
@@ -148,6 +238,8 @@ def Job_assistant():
         st.session_state.country_indeed = "USA"
     if 'job_search_results' not in st.session_state:
         st.session_state.job_search_results = pd.DataFrame()
+    if 'search_per_site' not in st.session_state:
+        st.session_state.search_per_site = True
     
     # Tabs for functionalities
     tab1, tab2 = st.tabs(["Resume Analysis", "Direct Job Search"])
@@ -175,135 +267,114 @@ def Job_assistant():
         
         if uploaded_resume:
             st.session_state.uploaded_resume = uploaded_resume
-            # Process Resume
-            with st.spinner("Analyzing Resume..."):
-                try:
-                    # Extract resume text
-                    resume_text = process_file(uploaded_resume)
-                    # logger.info("Resume extracted successfully")
-                    
-                    # Extract structured CV data
-                    candidates = extract_cv_data(resume_text)
-                    
-                    if not candidates:
-                        st.error("Could not extract resume data")
-                        # logger.error("No candidates extracted from resume")
+            resume_hash = content_hash(uploaded_resume.getvalue())
+
+            # Only re-run the pipeline when the resume itself changed; other reruns
+            # (e.g. submitting the job search form) render the stored results
+            if st.session_state.resume_hash != resume_hash:
+                # Process Resume
+                with st.spinner("Analyzing Resume..."):
+                    try:
+                        # Extract resume text
+                        resume_text = process_file(uploaded_resume)
+                        # logger.info("Resume extracted successfully")
+                    except Exception as e:
+                        st.error(f"Resume Processing Error: {e}")
+                        # logger.error(f"Resume Processing Error: {e}")
                         st.stop()
-                    
-                    st.session_state.resume_data = candidates[0]
-
-                    # Display extracted candidate information
-                    st.subheader("Resume Analysis")
-                    display_candidates_info(candidates)
-                    
-                    resume_data = candidates[0]
-                
-                except Exception as e:
-                    st.error(f"Resume Processing Error: {e}")
-                    # logger.error(f"Resume Processing Error: {e}")
-                    st.stop()
-            
-            # Initialize Job Suggestion Engine
-            if st.session_state.resume_data:
-                suggestion_engine = JobSuggestionEngine()
-                # logger.info("Job_Suggestion_Engine initialized")
-                
-                # Generate Job Suggestions
-                job_suggestions = suggestion_engine.generate_job_suggestions(resume_data)
-                # logger.info(f"Generated {len(job_suggestions)} job suggestions")
-
-                st.session_state.job_suggestions = job_suggestions
-
-                # Display Job Suggestions
-                st.header("🎯 Job Suggestions")
-                # for suggestion in job_suggestions:
-                for suggestion in st.session_state.job_suggestions:
-                    with st.expander(f"{suggestion.get('role', 'Unnamed Role')}"):
-                        st.write(f"**Description:** {suggestion.get('description', 'No description')}")
-                        st.write(f"**Suitability:** {suggestion.get('suitability_reason', 'Not specified')}")
-
-
-            try:
-                    # Extract resume text
-                    resume_text = process_file(uploaded_resume)
-                    # logger.info("Resume text extracted again for improvement suggestions")
-
-                    # Initialize Resume Improvement Engine
-                    improvement_engine = ResumeImprovementEngine()
-                    
-                    # Generate Improvement Suggestions
-                    improvement_suggestions = improvement_engine.generate_resume_improvement_suggestions(resume_text)
-                    # logger.info("Resume improvement suggestions generated")
-                    st.session_state.improvement_suggestions = improvement_suggestions
-
-                    # Display Suggestions
-                    st.subheader("🔍 Comprehensive Resume Analysis")
-                    
-                    # Overall Assessment
-                    if improvement_suggestions.get('overall_assessment'):
-                        with st.expander("📊 Overall Assessment"):
-                            st.write("**Strengths:**")
-                            for strength in improvement_suggestions['overall_assessment'].get('strengths', []):
-                                st.markdown(f"- {strength}")
-                            
-                            st.write("**Weaknesses:**")
-                            for weakness in improvement_suggestions['overall_assessment'].get('weaknesses', []):
-                                st.markdown(f"- {weakness}")
-                    
-                    # Section Recommendations
-                    if improvement_suggestions.get('section_recommendations'):
-                        with st.expander("📝 Section-by-Section Recommendations"):
-                            for section, details in improvement_suggestions['section_recommendations'].items():
-                                st.subheader(f"{section.replace('_', ' ').title()} Section")
-                                st.write(f"**Current Status:** {details.get('current_status', 'No assessment')}")
-                                
-                                st.write("**Improvement Suggestions:**")
-                                for suggestion in details.get('improvement_suggestions', []):
-                                    st.markdown(f"- {suggestion}")
-                    
-                    # Additional Insights
-                    st.subheader("✨ Additional Recommendations")
-                    
-                    # Writing Improvements
-                    if improvement_suggestions.get('writing_improvements'):
-                        with st.expander("✍️ Writing & Formatting Advice"):
-                            st.write("**Language Suggestions:**")
-                            for lang_suggestion in improvement_suggestions['writing_improvements'].get('language_suggestions', []):
-                                st.markdown(f"- {lang_suggestion}")
-                            
-                            st.write("**Formatting Advice:**")
-                            for format_advice in improvement_suggestions['writing_improvements'].get('formatting_advice', []):
-                                st.markdown(f"- {format_advice}")
-                    
-                    # Additional Sections
-                    if improvement_suggestions.get('additional_sections_recommended'):
-                        with st.expander("📋 Suggested Additional Sections"):
-                            for section in improvement_suggestions['additional_sections_recommended']:
-                                st.markdown(f"- {section}")
-                    
-                    # Keyword Optimization
-                    if improvement_suggestions.get('keyword_optimization'):
-                        with st.expander("🔑 Keyword & ATS Optimization"):
-                            st.write("**Missing Industry Keywords:**")
-                            for keyword in improvement_suggestions['keyword_optimization'].get('missing_industry_keywords', []):
-                                st.markdown(f"- {keyword}")
-                            
-                            st.write(f"**ATS Compatibility Score:** {improvement_suggestions['keyword_optimization'].get('ats_compatibility_score', 'Not available')}")
-                    
-                    # Career Positioning
-                    if improvement_suggestions.get('career_positioning'):
-                        with st.expander("🎯 Career Positioning"):
-                            st.write("**Personal Branding Suggestions:**")
-                            for branding_suggestion in improvement_suggestions['career_positioning'].get('personal_branding_suggestions', []):
-                                st.markdown(f"- {branding_suggestion}")
-                            
-                            st.write("**Skill Highlighting Recommendations:**")
-                            for skill_suggestion in improvement_suggestions['career_positioning'].get('skill_highlighting_recommendations', []):
-                                st.markdown(f"- {skill_suggestion}")
-                
-            except Exception as e:
-                    st.error(f"Resume Improvement Analysis Error: {e}")
-                    # logger.error(f"Resume Improvement Analysis Error: {e}")
+
+                    # One slot per section, so each renders in place as soon as its stage is done
+                    analysis_box, suggestions_box, improvement_box = st.container(), st.container(), st.container()
+                    with improvement_box:
+                        st.subheader("🔍 Comprehensive Resume Analysis")
+                        preview = st.empty()
+                    tokens = queue.Queue()
+                    streamed = []
+
+                    def show_progress():
+                        # Drain tokens streamed by the improvement stage into the live preview
+                        while not tokens.empty():
+                            streamed.append(tokens.get_nowait())
+                        if streamed:
+                            preview.code("".join(streamed), language="json")
+
+                    def extract_stage():
+                        candidates = extract_cv_data(resume_text)
+                        if not candidates:
+                            raise ValueError("Could not extract resume data")
+                        return candidates
+
+                    # An empty answer is a failed stage, so it is reported and the resume is not marked as analysed
+                    def suggest_stage(candidates):
+                        suggestions = JobSuggestionEngine().generate_job_suggestions(candidates[0])
+                        if not suggestions:
+                            raise ValueError("No job suggestions were generated")
+                        return suggestions
+
+                    def improve_stage():
+                        improvements = ResumeImprovementEngine().generate_resume_improvement_suggestions(resume_text, on_token=tokens.put)
+                        if not improvements:
+                            raise ValueError("No improvement suggestions were generated")
+                        return improvements
+
+                    # Improvement only needs the raw text, so it runs alongside extraction;
+                    # job suggestions wait for the extracted profile
+                    ctx = get_script_run_ctx()
+                    executor = StageExecutor(
+                        max_workers=3,
+                        initializer=lambda: add_script_run_ctx(threading.current_thread(), ctx),
+                    )
+                    executor.add("extract", extract_stage)
+                    executor.add("suggest", suggest_stage, deps=("extract",))
+                    executor.add("improve", improve_stage)
+
+                    all_ok = True
+                    for stage, result, error in executor.run(poll=show_progress):
+                        all_ok = all_ok and error is None
+
+                        if stage == "extract":
+                            with analysis_box:
+                                if error:
+                                    st.error(f"Resume Processing Error: {error}")
+                                    # logger.error(f"Resume Processing Error: {error}")
+                                    continue
+                                st.session_state.resume_candidates = result
+                                st.session_state.resume_data = result[0]
+
+                                # Display extracted candidate information
+                                st.subheader("Resume Analysis")
+                                display_candidates_info(result)
+
+                        elif stage == "suggest":
+                            if error:
+                                with suggestions_box:
+                                    st.error(f"Job Suggestion Error: {error}")
+                                continue
+                            st.session_state.job_suggestions = result
+                            # logger.info(f"Generated {len(result)} job suggestions")
+                            with suggestions_box:
+                                render_job_suggestions(result)
+
+                        elif stage == "improve":
+                            preview.empty()
+                            with improvement_box:
+                                if error:
+                                    st.error(f"Resume Improvement Analysis Error: {error}")
+                                    # logger.error(f"Resume Improvement Analysis Error: {error}")
+                                    continue
+                                # logger.info("Resume improvement suggestions generated")
+                                st.session_state.improvement_suggestions = result
+                                render_improvement_suggestions(result)
+
+                if all_ok:
+                    st.session_state.resume_hash = resume_hash
+
+            else:
+                st.subheader("Resume Analysis")
+                display_candidates_info(st.session_state.resume_candidates)
+                render_job_suggestions(st.session_state.job_suggestions)
+                st.subheader("🔍 Comprehensive Resume Analysis")
+                render_improvement_suggestions(st.session_state.improvement_suggestions)
 
 
     with tab2:
@@ -340,11 +411,14 @@ def Job_assistant():
                 with col6:
                     country_indeed = st.text_input("Country (for Indeed)", st.session_state.country_indeed)
 
+                search_per_site = st.checkbox("Search sites in parallel (show each site as it arrives)", value=st.session_state.search_per_site)
+
                 # Submit button inside the form
                 submit_button = st.form_submit_button("Search Jobs")
 
                 # Only run search when form is submitted
         if submit_button:
+            st.session_state.search_per_site = search_per_site
             st.session_state.site_name = site_name
             st.session_state.search_term = search_term
             st.session_state.location = location
@@ -355,35 +429,73 @@ def Job_assistant():
             with st.spinner("Searching Jobs..."):
                 try:
                     # Your existing job search code here
-                    jobs = scrape_jobs(
+                    search_params = dict(
                         site_name=site_name,
                         search_term=search_term,
-                        google_search_term=f"{search_term} jobs near {location}",
                         location=location,
                         results_wanted=results_wanted,
                         hours_old=hours_old,
                         country_indeed=country_indeed,
                     )
-                    st.session_state.job_search_results = jobs
+                    if st.session_state.search_per_site and len(site_name) > 1:
+                        # Each site has its own worker and timeout; rows appear as each site finishes
+                        site_frames = []
+                        live_table = st.empty()
+                        for site, site_jobs, site_status, site_error in search_jobs_by_site(**search_params):
+                            if site_error:
+                                st.warning(f"{site}: no results ({site_error})")
+                                continue
+                            st.caption(f"{site}: {len(site_jobs)} jobs · {describe_cache_status(site_status)}")
+                            if len(site_jobs) > 0:
+                                site_frames.append(site_jobs)
+                                st.session_state.job_search_results = pd.concat(site_frames, ignore_index=True)
+                                live_table.dataframe(st.session_state.job_search_results[['site', 'title', 'company', 'location', 'date_posted']])
+                        live_table.empty()
+                        jobs = st.session_state.job_search_results = pd.concat(site_frames, ignore_index=True) if site_frames else pd.DataFrame()
+                        cache_status = None
+                    else:
+                        # Identical searches are served from the shared cache (stale results refresh in the background)
+                        jobs, cache_status = search_jobs(**search_params)
+                        st.session_state.job_search_results = jobs
 
                     if len(jobs) > 0:
                         st.success(f"Found {len(jobs)} jobs")
-                        
-                        jobs_filtered = jobs[['site', 'job_url', 'title', 'company', 'location', 'date_posted']]
-                        jobs_filtered['job_url'] = jobs_filtered['job_url'].apply(make_clickable_link)
-                        st.write(jobs_filtered.to_html(escape=False), unsafe_allow_html=True)
-                        
-                        csv_file = jobs.to_csv(index=False)
-                        st.download_button(
-                            label="Download Jobs as CSV",
-                            data=csv_file,
-                            file_name='job_search_results.csv',
-                            mime='text/csv'
-                        )
+                        if cache_status:
+                            st.caption(describe_cache_status(cache_status))
+
+                        if st.session_state.resume_candidates:
+                            # Rank every posting against the analyzed resume in one pass, no LLM calls
+                            st.session_state.job_search_results = rank_search_results(
+                                jobs, search_params, st.session_state.resume_candidates[0]
+                            )
                     else:
                         st.warning("No jobs found")
                 
                 except Exception as e:
                     st.error(f"Job Search Error: {e}")
                     # logger.error(f"Job Search Error: {e}")
+
+        # Render from session state so paging and sorting reruns keep the results on screen
+        jobs = st.session_state.job_search_results
+        if len(jobs) > 0:
+            display_columns = ['site', 'job_url', 'title', 'company', 'location', 'date_posted']
+            if 'match_score' in jobs.columns:
+                display_columns = ['match_score'] + display_columns
+                st.caption(f"Top {len(jobs)} postings by match with the resume from the Resume Analysis tab")
+
+            with metrics.span("render", view="jobs"):
+                render_result_table(
+                    jobs[display_columns],
+                    key="job_results",
+                    link_columns=('job_url',),
+                    default_sort='match_score' if 'match_score' in jobs.columns else None,
+                )
+
+            csv_file = jobs.to_csv(index=False)
+            st.download_button(
+                label="Download Jobs as CSV",
+                data=csv_file,
+                file_name='job_search_results.csv',
+                mime='text/csv'
+            )
    
\ No newline at end of file
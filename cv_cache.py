@@ -0,0 +1,163 @@
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Where the extraction cache lives and how big/old it may get (overridable through the environment)
+DEFAULT_CACHE_PATH = os.getenv("CV_CACHE_PATH", os.path.join(".cache", "cv_extraction.sqlite3"))
+DEFAULT_MAX_ENTRIES = int(os.getenv("CV_CACHE_MAX_ENTRIES", "10000"))
+DEFAULT_MAX_AGE = float(os.getenv("CV_CACHE_MAX_AGE_DAYS", "30")) * 24 * 3600
+MEMORY_ENTRIES = 256
+
+
+def content_hash(content: Union[str, bytes]) -> str:
+    """SHA-256 hex digest of raw bytes or of whitespace-normalized text."""
+    if isinstance(content, str):
+        content = re.sub(r"\s+", " ", content).strip().encode("utf-8")
+    return hashlib.sha256(content).hexdigest()
+
+
+class ExtractionCache:
+    """
+        Persistent content-addressed cache for structured CV extraction.
+
+        Keys combine the resume content hash with a version string (prompt +
+        model), values are the serialized extraction output. A small in-memory
+        LRU sits in front of SQLite so repeated lookups in one process skip disk.
+        Entries older than `max_age` seconds are dropped and the table is trimmed
+        to `max_entries` by least recent use.
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 max_age: float = DEFAULT_MAX_AGE):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+        self._memory: OrderedDict[str, tuple[str, float]] = OrderedDict()  # key -> (value, created)
+        # Memory hits since the last evict(), written to `accessed` before trimming
+        self._touched: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS extraction ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " created REAL NOT NULL,"
+            " accessed REAL NOT NULL)"
+        )
+        self._conn.commit()
+        self.evict()
+
+    @staticmethod
+    def make_key(content: Union[str, bytes], version: str) -> str:
+        return content_hash(version.encode("utf-8") + b"\0" + content_hash(content).encode("ascii"))
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            if key in self._memory:
+                value, created = self._memory[key]
+                if now - created > self.max_age:
+                    del self._memory[key]
+                    self.misses += 1
+                    return None
+                self._memory.move_to_end(key)
+                self._touched[key] = now
+                self.hits += 1
+                return value
+
+            row = self._conn.execute(
+                "SELECT value, created FROM extraction WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[1] > self.max_age:
+                self.misses += 1
+                return None
+
+            self._conn.execute("UPDATE extraction SET accessed = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self._remember(key, row[0], row[1])
+            self.hits += 1
+            return row[0]
+
+    def set(self, key: str, value: str):
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO extraction (key, value, created, accessed) VALUES (?, ?, ?, ?)",
+                (key, value, now, now),
+            )
+            self._conn.commit()
+            self._remember(key, value, now)
+            self._touched.pop(key, None)
+            self._writes += 1
+        # Eviction scans the table, so only run it every so often
+        if self._writes % 100 == 0:
+            self.evict()
+
+    def evict(self):
+        """Drop expired entries and trim the table to max_entries; only those entries leave the memory LRU."""
+        with self._lock:
+            if not self._conn.in_transaction:
+                self._conn.execute("BEGIN IMMEDIATE")
+            # Memory hits count as use, so hot entries are not trimmed as least recently used
+            self._conn.executemany(
+                "UPDATE extraction SET accessed = ? WHERE key = ?",
+                [(accessed, key) for key, accessed in self._touched.items()],
+            )
+            self._touched.clear()
+            # SELECT then DELETE in the same transaction (DELETE ... RETURNING needs SQLite 3.35)
+            deleted = self._conn.execute(
+                "SELECT key FROM extraction WHERE created < ? OR key NOT IN "
+                "(SELECT key FROM extraction WHERE created >= ? ORDER BY accessed DESC LIMIT ?)",
+                (time.time() - self.max_age,) * 2 + (self.max_entries,),
+            ).fetchall()
+            self._conn.executemany("DELETE FROM extraction WHERE key = ?", deleted)
+            self._conn.commit()
+            for (key,) in deleted:
+                self._memory.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM extraction")
+            self._conn.commit()
+            self._memory.clear()
+            self._touched.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            size = self._conn.execute("SELECT COUNT(*) FROM extraction").fetchone()[0]
+        return {"hits": self.hits, "misses": self.misses, "entries": size}
+
+    def _remember(self, key: str, value: str, created: float):
+        self._memory[key] = (value, created)
+        self._memory.move_to_end(key)
+        while len(self._memory) > MEMORY_ENTRIES:
+            self._memory.popitem(last=False)
+
+
+_cache: Optional[ExtractionCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> ExtractionCache:
+    """Process-wide extraction cache, opened on first use."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ExtractionCache()
+            logger.info(f"Opened extraction cache at {_cache.path}")
+        return _cache
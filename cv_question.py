@@ -1,19 +1,19 @@
 import streamlit as st
-from langchain_groq import ChatGroq
 from langchain.prompts import ChatPromptTemplate
 import os
 import tempfile
 import json
+from typing import Iterator
+from llm_clients import get_chat_groq, get_groq_api_key
+import metrics
+import rate_limiter
+from compaction import count_tokens
 from extraction import extract_cv_data, process_file, display_candidates_info  # importing from your extraction.py
 
-# Initialize environment variables
-# os.environ['GROQ_API_KEY'] = os.getenv("GROQ_API_KEY")
-groq_api_key = os.getenv("GROQ_API_KEY")
-
 class InterviewQuestionGenerator:
     def __init__(self):
-        self.llm = ChatGroq(
-            groq_api_key=groq_api_key,
+        self.llm = get_chat_groq(
+            groq_api_key=get_groq_api_key(),
             # model_name="mixtral-8x7b-32768",
             model_name = "llama3-8b-8192",
             temperature=0.7,
@@ -66,19 +66,45 @@ class InterviewQuestionGenerator:
         self.question_prompt = ChatPromptTemplate.from_messages(
             [
                 ("system", self.question_template),
-                ("human", "{cv_text}\n{skills}")
+                # The CV text is already in the system message; don't pay for it twice
+                ("human", "Generate the interview questions for this candidate.")
             ]
         )
         
+    def _estimate_tokens(self, cv_text: str, skills: str) -> int:
+        """Prompt plus a typical five-question answer, reserved against the tokens-per-minute limit."""
+        return count_tokens(self.question_template + cv_text + skills) + 800
+
     def generate_questions(self, cv_text: str, skills: str) -> str:
         """Generate interview questions based on CV text and skills."""
         runnable = self.question_prompt | self.llm  # Using Runnable instead of LLMChain
-        questions = runnable.invoke({
-            "cv_text": cv_text,
-            "skills": skills
-        })
+        with metrics.span("llm", model=self.llm.model_name):
+            questions = rate_limiter.call(
+                self.llm.model_name,
+                lambda: runnable.invoke({
+                    "cv_text": cv_text,
+                    "skills": skills
+                }),
+                tokens=self._estimate_tokens(cv_text, skills),
+            )
         return questions
 
+    def stream_questions(self, cv_text: str, skills: str) -> Iterator[str]:
+        """Generate interview questions, yielding text as tokens arrive."""
+        runnable = self.question_prompt | self.llm
+        # Covers the whole stream, including the time the page spends writing each chunk
+        with metrics.span("llm", model=self.llm.model_name, streaming="true"):
+            for chunk in rate_limiter.stream(
+                self.llm.model_name,
+                lambda: runnable.stream({
+                    "cv_text": cv_text,
+                    "skills": skills
+                }),
+                tokens=self._estimate_tokens(cv_text, skills),
+            ):
+                if chunk.content:
+                    yield chunk.content
+
 
 def create_interview_questions_page():
     # Initializing session state variables since they dont exist at first
@@ -115,16 +141,16 @@ def create_interview_questions_page():
         if st.session_state.candidates_list:
             display_candidates_info(st.session_state.candidates_list)
             
-            # Generate questions if not already generated
+            st.subheader("Recommended Interview Questions")
+
+            # Generate questions if not already generated, rendering them as they stream in
             if st.session_state.generated_questions is None:
                 candidate = st.session_state.candidates_list[0]
                 generator = InterviewQuestionGenerator()
-                questions = generator.generate_questions(
+                st.session_state.generated_questions = st.write_stream(generator.stream_questions(
                     cv_text=st.session_state.cv_text,
                     skills=", ".join(candidate.skills)
-                )
-                st.session_state.generated_questions = questions.content
-
-            # Display the generated questions
-            st.subheader("Recommended Interview Questions")
-            st.markdown(st.session_state.generated_questions)
\ No newline at end of file
+                ))
+            else:
+                # Display the generated questions
+                st.markdown(st.session_state.generated_questions)
\ No newline at end of file
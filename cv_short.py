@@ -1,33 +1,67 @@
 import logging
-from langchain_community.document_loaders import PDFPlumberLoader, TextLoader
+import os
+import threading
+from typing import Optional
+from pydantic import BaseModel
 import extraction as extr # extraction.py
+import fast_extract
+import metrics
+import rate_limiter
+from cv_cache import content_hash, get_cache
+from parallel import run_bounded
+from scoring import score_candidates
+from result_viewer import render_result_table
+from shortlist import ShortlistResults
 import streamlit as st
-import pandas as pd
+
+# Concurrency defaults for batch extraction (overridable through the environment)
+DEFAULT_MAX_WORKERS = int(os.getenv("CV_MAX_WORKERS", "4"))
+DEFAULT_TIMEOUT = float(os.getenv("CV_TIMEOUT", "120"))
 
 # Configure logging
 # logging.basicConfig(level=logging.DEBUG , format='%(asctime)s - %(levelname)s - %(message)s')
 # logger = logging.getLogger(__name__)
 
 
+class ExtractionResult(BaseModel):
+    """Outcome of extracting a single uploaded CV in a batch."""
+    file_name: str
+    candidates: list[extr.cv] = []
+    error: Optional[str] = None
+
+
 class CVAnalyzer:
 
-    def __init__(self):
-        # Initialize Groq LLM
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS, timeout: float = DEFAULT_TIMEOUT):
         # logger.info("Initializing CVAnalyzer")
 
-        self.llm = extr.initialize_llm()  # Updated to use the new function
-        
-        # logger.info(" LLM initialized")
+        self.max_workers = max_workers
+        self.timeout = timeout
+        # Built on first extraction, so reusing earlier results or only scoring needs no Groq key
+        self._llm: Optional[list] = None
+        self._llm_lock = threading.Lock()
         # Initialize embeddings (if needed)
         # self.embeddings = HuggingFaceEmbeddings(
         #     model_name="sentence-transformers/all-mpnet-base-v2"
         # )
 
+    @property
+    def llm(self) -> list:
+        """The extraction cascade: small model first, escalated on failed checks."""
+        with self._llm_lock:
+            if self._llm is None:
+                self._llm = extr.initialize_cascade(timeout=self.timeout)
+                # logger.info(" LLM initialized")
+            return self._llm
+
     def load_document(self, file_path: str) -> str:
         # logger.info(f"Loading document from file: {file_path}")
 
         """Load document based on file type."""
 
+        # langchain_community is slow to import and only needed here
+        from langchain_community.document_loaders import PDFPlumberLoader, TextLoader
+
         if file_path.endswith('.pdf'):
             loader = PDFPlumberLoader(file_path)
         else:
@@ -43,11 +77,131 @@ class CVAnalyzer:
 
         """Extract structured information from CV text using new extraction method."""
 
-        extracted_data = extr.extract_cv_data(cv_text)
+        # Shortlisting is bulk work: interactive single-resume requests are served first
+        with rate_limiter.priority(rate_limiter.BULK):
+            extracted_data = extr.extract_cv_data(cv_text, llm=self.llm)
         # logger.info(f"Extracted {len(extracted_data)} candidate(s) from CV")
         return extracted_data
         # return extr.extract_cv_data(cv_text) 
 
+    def _extract_file(self, uploaded_file) -> list[extr.cv]:
+        """Parse one uploaded file and extract its candidates."""
+        return self.extract_cv_info(extr.process_file(uploaded_file))
+
+    def extract_batch(self, uploaded_files, pack: bool = False) -> list[ExtractionResult]:
+        """
+            Extract candidates from many uploaded files concurrently.
+
+            At most `max_workers` files are processed at once and each one gets
+            `timeout` seconds. A failing or timed out file is reported in its own
+            result instead of aborting the batch. Results keep the upload order.
+
+            With `pack`, short CVs are grouped into shared LLM requests (see
+            extraction.extract_packed_cv_data); groups whose answer cannot be
+            mapped back to their files are retried one file at a time.
+        """
+        if pack:
+            return self._extract_batch_packed(uploaded_files)
+
+        results: list[Optional[ExtractionResult]] = [None] * len(uploaded_files)
+
+        for (index, uploaded_file), candidates, error in run_bounded(
+            lambda item: self._extract_file(item[1]),
+            list(enumerate(uploaded_files)),
+            max_workers=self.max_workers,
+            timeout=self.timeout,
+        ):
+            results[index] = ExtractionResult(
+                file_name=uploaded_file.name,
+                candidates=candidates or [],
+                error=str(error) if error else None,
+            )
+            # logger.info(f"Finished {uploaded_file.name}")
+
+        return results
+
+    def extract_new(self, uploaded_files, pool: dict[str, ExtractionResult],
+                    pack: bool = False) -> list[ExtractionResult]:
+        """
+            Like extract_batch, but only for uploads whose content is not in `pool` yet.
+
+            `pool` maps file content hashes to earlier successful results and is
+            updated in place; failures are left out of it so they are retried.
+            Uploads with identical content are extracted once. Returns a result
+            for every upload, in upload order.
+        """
+        hashes = [content_hash(uploaded_file.getvalue()) for uploaded_file in uploaded_files]
+        first: dict[str, int] = {}
+        for i, file_hash in enumerate(hashes):
+            first.setdefault(file_hash, i)
+        new = [i for file_hash, i in first.items() if file_hash not in pool]
+        # logger.info(f"{len(new)} new file(s), {len(uploaded_files) - len(new)} reused from the pool")
+
+        extracted = self.extract_batch([uploaded_files[i] for i in new], pack=pack) if new else []
+        fresh = {hashes[i]: result for i, result in zip(new, extracted)}
+        for file_hash, result in fresh.items():
+            if result.error is None:
+                pool[file_hash] = result
+
+        return [
+            (fresh.get(file_hash) or pool[file_hash]).model_copy(update={"file_name": uploaded_file.name})
+            for uploaded_file, file_hash in zip(uploaded_files, hashes)
+        ]
+
+    def _extract_packed(self, texts: list[str]) -> Optional[list[list[extr.cv]]]:
+        with rate_limiter.priority(rate_limiter.BULK):
+            return extr.extract_packed_cv_data(texts, llm=self.llm)
+
+    def _extract_batch_packed(self, uploaded_files) -> list[ExtractionResult]:
+        results: list[Optional[ExtractionResult]] = [None] * len(uploaded_files)
+        texts: dict[int, str] = {}
+
+        # Parse every file first so the packer knows the text sizes
+        for (index, uploaded_file), text, error in run_bounded(
+            lambda item: extr.process_file(item[1]),
+            list(enumerate(uploaded_files)),
+            max_workers=self.max_workers,
+            timeout=self.timeout,
+        ):
+            if error:
+                results[index] = ExtractionResult(file_name=uploaded_file.name, error=str(error))
+            else:
+                texts[index] = text
+
+        parsed = sorted(texts)
+        groups = [[parsed[i] for i in group] for group in extr.pack_texts(
+            [texts[i] for i in parsed],
+            # Packed requests go to the first (smallest) model of the cascade
+            context_window=extr.context_window(self.llm[0].model_name),
+        )]
+        fallback: list[int] = []
+
+        for group, packed, error in run_bounded(
+            lambda group: self._extract_packed([texts[i] for i in group]),
+            groups,
+            max_workers=self.max_workers,
+            timeout=self.timeout,
+        ):
+            if error or packed is None:
+                fallback.extend(group)
+                continue
+            for index, candidates in zip(group, packed):
+                results[index] = ExtractionResult(file_name=uploaded_files[index].name, candidates=candidates)
+
+        for index, candidates, error in run_bounded(
+            lambda index: self.extract_cv_info(texts[index]),
+            fallback,
+            max_workers=self.max_workers,
+            timeout=self.timeout,
+        ):
+            results[index] = ExtractionResult(
+                file_name=uploaded_files[index].name,
+                candidates=candidates or [],
+                error=str(error) if error else None,
+            )
+
+        return results
+
     def calculate_match_score(self, cv_info: dict, jd_requirements: dict) -> dict:
         # logger.info(f"Calculating match score for CV: {cv_info.get('name', 'Unknown')}")
 
@@ -84,6 +238,11 @@ class CVAnalyzer:
 
         return score_components
 
+    @metrics.timed("score")
+    def calculate_match_scores(self, cv_infos: list[dict], jd_requirements: dict, fuzzy: bool = False) -> dict:
+        """Calculate match scores for many CVs at once (arrays aligned with cv_infos)."""
+        return score_candidates(cv_infos, jd_requirements, fuzzy=fuzzy)
+
 
 def create_cv_shortlisting_page():
 # Initialize session state variables if they don't exist
@@ -95,10 +254,16 @@ def create_cv_shortlisting_page():
         st.session_state.required_skills_list = []
     if 'uploaded_files' not in st.session_state:
         st.session_state.uploaded_files = None
-    if 'results' not in st.session_state:
-        st.session_state.results = []
+    if 'shortlist' not in st.session_state:
+        st.session_state.shortlist = None
+    if 'candidate_pool' not in st.session_state:
+        st.session_state.candidate_pool = {}
     if 'analysis_complete' not in st.session_state:
         st.session_state.analysis_complete = False
+    if 'pack_cvs' not in st.session_state:
+        st.session_state.pack_cvs = False
+    if 'fuzzy_skills' not in st.session_state:
+        st.session_state.fuzzy_skills = False
 
     # Form for input
     with st.form("job_description_form"):
@@ -112,10 +277,13 @@ def create_cv_shortlisting_page():
         
         required_skills = st.text_input("Required skills (comma-separated)", 
                                         value=','.join(st.session_state.required_skills_list) if st.session_state.required_skills_list else "")
+        fuzzy_skills = st.checkbox("Match similar skill names (e.g. Postgres / PostgreSQL)", value=st.session_state.fuzzy_skills)
         
         # CV Upload
         st.header("Upload CVs")
         uploaded_files = st.file_uploader("Choose CV files", accept_multiple_files=True, type=['pdf', 'txt'], key="unique_cv_upload")
+        pack_cvs = st.checkbox("Pack short CVs into shared requests", value=st.session_state.pack_cvs,
+                               help="Sends several short CVs per LLM request; fewer requests for large uploads")
         
         # Submit Button
         submit_button = st.form_submit_button(label="Analyze CVs")
@@ -126,6 +294,8 @@ def create_cv_shortlisting_page():
         st.session_state.min_years = min_years
         st.session_state.required_skills_list = [skill.strip() for skill in required_skills.split(",") if skill.strip()]
         st.session_state.uploaded_files = uploaded_files
+        st.session_state.pack_cvs = pack_cvs
+        st.session_state.fuzzy_skills = fuzzy_skills
 
         if st.session_state.uploaded_files and st.session_state.jd_text:
             with st.spinner('Analyzing CVs...'):
@@ -137,44 +307,62 @@ def create_cv_shortlisting_page():
                     "required_skills": st.session_state.required_skills_list
                 }
                 
-                results = []
-                st.session_state.results = []  # Reset results for new analysis
-
-                # Process each CV
-                for uploaded_file in st.session_state.uploaded_files:
-                    cv_text = extr.process_file(uploaded_file)
-                    
-                    try:
-                        candidates = analyzer.extract_cv_info(cv_text)
-                        
-                        for candidate in candidates:
-                            match_scores = analyzer.calculate_match_score(
-                                candidate.__dict__, 
-                                job_requirements
-                            )
-                            
-                            result = {
-                                "Name": candidate.name or "Unknown",
-                                "Experience (Years)": candidate.years_of_exp or 0,
-                                "Skills": ", ".join(candidate.skills) if candidate.skills else "None",
-                                "Certifications": ", ".join(candidate.certifications) if candidate.certifications else "None",
-                                "Skills Match": f"{match_scores['skills_match']:.2%}",
-                                "Experience Match": f"{match_scores['experience_match']:.2%}",
-                                "Overall Score": f"{match_scores['overall_score']:.2%}"
-                            }
-                            
-                            results.append(result)
-                            st.session_state.results.append(result)
-                            
-                    except Exception as e:
-                        st.error(f"Error processing CV: {str(e)}")
-                
-            # Display results
-            if st.session_state.results:
-                df = pd.DataFrame(st.session_state.results)
-                df = df.sort_values("Overall Score", ascending=False)
-                st.dataframe(df)
+                st.session_state.shortlist = None  # Reset results for new analysis
+
+                # Only files not seen before are parsed and extracted (concurrently, each succeeding
+                # or failing on its own); a requirements change just re-scores the pool
+                pool = st.session_state.candidate_pool
+                known = set(pool)
+                extractions = analyzer.extract_new(st.session_state.uploaded_files, pool, pack=st.session_state.pack_cvs)
+                current = {content_hash(uploaded_file.getvalue()) for uploaded_file in st.session_state.uploaded_files}
+                for file_hash in set(pool) - current:
+                    del pool[file_hash]
+                st.caption(f"{len(current & known)} CV(s) reused from this session, {len(current - known)} extracted")
+
+                candidates = []
+                files = []
+                for extraction in extractions:
+                    if extraction.error:
+                        st.error(f"Error processing CV {extraction.file_name}: {extraction.error}")
+                        continue
+                    candidates.extend(candidate.model_dump() for candidate in extraction.candidates)
+                    files.extend([extraction.file_name] * len(extraction.candidates))
+
+                # Score every candidate in one vectorized pass; scores stay floats until display
+                match_scores = analyzer.calculate_match_scores(
+                    candidates,
+                    job_requirements,
+                    fuzzy=st.session_state.fuzzy_skills
+                )
+                if candidates:
+                    st.session_state.shortlist = ShortlistResults.from_candidates(candidates, match_scores, files=files)
+
+            if st.session_state.shortlist:
+                cache_stats = get_cache().stats()
+                st.caption(f"Extraction cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses, {cache_stats['entries']} stored")
+                fast_stats = fast_extract.stats.as_dict()
+                st.caption(f"Fast path: {fast_stats['llm_calls_avoided']} LLM calls avoided, {fast_stats['llm_calls']} still needed")
+                if extr.cascade_stats.as_dict():
+                    st.caption(f"Model cascade: {extr.cascade_stats.summary()}")
                 st.session_state.analysis_complete = True
             else:
                 st.error("No valid results found from CV analysis")
                 st.session_state.analysis_complete = False
+
+    # Display results from session state so paging and sorting reruns keep them on screen
+    if st.session_state.analysis_complete and st.session_state.shortlist:
+        shortlist = st.session_state.shortlist
+        top_n = st.number_input("Show the top N candidates (0 for all)", min_value=0,
+                                value=min(100, len(shortlist)), key="shortlist_top_n")
+        if top_n:
+            shortlist = shortlist.top_k(top_n)
+        with metrics.span("render", view="shortlist"):
+            render_result_table(
+                shortlist.display_frame(),
+                key="shortlist_results",
+                default_sort="Overall Score",
+                column_config={
+                    column: st.column_config.NumberColumn(column, format="%.2f%%")
+                    for column in ("Skills Match", "Experience Match", "Overall Score")
+                },
+            )
@@ -4,13 +4,22 @@ from pydantic import BaseModel, Field
 from langchain.prompts import ChatPromptTemplate
 from langchain_groq import ChatGroq
 import os
-import tempfile
+import io
+import hashlib
+import re
+import threading
+from typing import Iterator
+import pdfplumber
 import streamlit as st
-from langchain_community.document_loaders import PDFPlumberLoader, TextLoader
+from cv_cache import ExtractionCache, get_cache
+from llm_clients import get_chat_groq, get_groq_api_key
+import fast_extract
+import metrics
+import rate_limiter
+from compaction import compact_pages, count_tokens
 
 
-# logging
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+# logging (configured by the entry point, app.py or shortlist_cli.py)
 logger = logging.getLogger(__name__)
 
 # Defining the CV structure using Pydantic for structured output
@@ -24,15 +33,38 @@ class cv(BaseModel):
 class data(BaseModel):
     candidates: list[cv]
 
-def create_prompt_template() -> ChatPromptTemplate:
+# A candidate extracted from a packed request, tagged with the CV it came from
+class packed_cv(cv):
+    source_cv: int = Field(description="Number of the '### CV <number>' block this candidate was extracted from")
 
-    logger.info("Creating the prompt template for CV extraction")
+class packed_data(BaseModel):
+    candidates: list[packed_cv]
 
-    """Create the prompt template for CV extraction."""
-    
-    return ChatPromptTemplate.from_messages(
-        [
-            ("system",
+# Model cascade, smallest first: each CV goes to the next model only when the previous answer
+# fails validate_candidates. CV_EXTRACTION_MODELS=llama-3.3-70b-versatile turns the cascade off.
+EXTRACTION_MODELS = [
+    model.strip()
+    for model in os.getenv("CV_EXTRACTION_MODELS", "llama3-8b-8192,llama-3.3-70b-versatile").split(",")
+    if model.strip()
+]
+EXTRACTION_MODEL = EXTRACTION_MODELS[-1]
+
+# Longest career we believe; anything outside 0..MAX_YEARS_OF_EXP is escalated
+MAX_YEARS_OF_EXP = 60
+# A CV with one of these has experience to report, so a missing years_of_exp is a miss
+EXPERIENCE_RE = re.compile(
+    r"^\s*((work |professional )?experience|employment( history)?|work history)\s*:?\s*$"
+    r"|\b\d{1,2}\s*\+?\s*(years?|yrs?)\b",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+# Context windows (tokens) of the extraction models; packed requests must fit the model they go to
+MODEL_CONTEXT_WINDOWS = {"llama3-8b-8192": 8192, "llama-3.3-70b-versatile": 131072}
+DEFAULT_CONTEXT_WINDOW = 8192
+# Tool schema, message framing and the "### CV <n>" headers of a packed request
+PACK_REQUEST_OVERHEAD = 512
+
+SYSTEM_PROMPT = (
         "You are an expert extraction algorithm. Your job is to extract the following specific information from the given text:"
          "- Name of the candidate"
          "- Skills"
@@ -43,85 +75,359 @@ def create_prompt_template() -> ChatPromptTemplate:
          "Extract it accurately, even if it's mentioned in different contexts like a professional summary or work experience. "
          "If multiple jobs are listed, you can calculate the experience from the work history."
         "Certifications are usually found under headers like 'Certifications,' 'Professional Certificates,' or similar. They might include phrases like 'AWS Certified Developer,' 'MongoDB Developer Associate,' etc."
-        ),
+)
+
+PACKED_PROMPT = SYSTEM_PROMPT + (
+    " The text contains several CVs, each one starting with a line '### CV <number>'."
+    " Return exactly one candidate per CV, in the same order, and set source_cv to that CV's number."
+)
+
+# Try the deterministic extractor first and only ask the LLM for what it could not find
+FAST_PATH_ENABLED = os.getenv("CV_FAST_PATH", "1") == "1"
+
+# Approximate prompt budget for one packed request (resume text only)
+PACK_TOKEN_BUDGET = int(os.getenv("CV_PACK_TOKEN_BUDGET", "6000"))
+
+# Rough size of one candidate in a structured answer, reserved against the tokens-per-minute limit
+COMPLETION_TOKENS_PER_CV = 150
+
+def extraction_version(fast_path: bool) -> str:
+    """Cached extractions are only valid for the prompt, models, schema and fast-path mode that produced them."""
+    mode = f"fast-v{fast_extract.FAST_PATH_VERSION}" if fast_path else "llm-only"
+    return hashlib.sha256(
+        f"{SYSTEM_PROMPT}|{','.join(EXTRACTION_MODELS)}|{MAX_YEARS_OF_EXP}|{EXPERIENCE_RE.pattern}|{sorted(cv.model_fields)}|{mode}".encode("utf-8")
+    ).hexdigest()[:16]
+
+EXTRACTION_VERSION = extraction_version(FAST_PATH_ENABLED)
+
+def create_prompt_template() -> ChatPromptTemplate:
+
+    logger.info("Creating the prompt template for CV extraction")
+
+    """Create the prompt template for CV extraction."""
+    
+    return ChatPromptTemplate.from_messages(
+        [
+            ("system", SYSTEM_PROMPT),
             ("human", "{text}")
         ]
     )
 
-def initialize_llm() -> ChatGroq:
-    logger.info("Initializing LLM")
+def initialize_llm(timeout: Optional[float] = None, model_name: str = EXTRACTION_MODEL) -> ChatGroq:
+    logger.info(f"Initializing LLM {model_name}")
 
     """Initialize the language model."""
 
-    # os.environ['GROQ_API_KEY'] = os.getenv("GROQ_API_KEY")
-    groq_api_key = os.getenv("GROQ_API_KEY")
-    if groq_api_key is None:
-        try:
-            groq_api_key = st.secrets["GROQ_API_KEY"]
-        except Exception as e:
-            st.error("GROQ_API_KEY is not set in the environment variables or Streamlit secrets.")
-            groq_api_key = None
-    # groq_api_key = st.secrets["GROQ_API_KEY"]
-
-    
-
+    groq_api_key = get_groq_api_key()
     if not groq_api_key:
         logger.error("GROQ_API_KEY is not set")
         raise ValueError("GROQ_API_KEY environment variable is missing.")
 
 
-    return ChatGroq(groq_api_key=groq_api_key, model_name="llama-3.3-70b-versatile", temperature=0.6)
+    # Shared per model/parameters, so repeated calls reuse pooled connections
+    return get_chat_groq(groq_api_key, model_name=model_name, temperature=0.6, timeout=timeout)
+
+def initialize_cascade(timeout: Optional[float] = None) -> list[ChatGroq]:
+    """One model per cascade tier (EXTRACTION_MODELS), smallest first."""
+    return [initialize_llm(timeout=timeout, model_name=model_name) for model_name in EXTRACTION_MODELS]
+
+class CascadeStats:
+    """Per model: how many extractions it answered and how many of those passed validation."""
+
+    def __init__(self):
+        self._tiers: dict[str, list[int]] = {}  # model -> [attempts, accepted]
+        self._lock = threading.Lock()
+
+    def record(self, model_name: str, accepted: bool):
+        with self._lock:
+            tier = self._tiers.setdefault(model_name, [0, 0])
+            tier[0] += 1
+            tier[1] += accepted
+
+    def as_dict(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            return {model: {"attempts": attempts, "accepted": accepted}
+                    for model, (attempts, accepted) in self._tiers.items()}
+
+    def summary(self) -> str:
+        """e.g. "llama3-8b-8192 42/50 accepted (84%), llama-3.3-70b-versatile 8/8 accepted (100%)"."""
+        return ", ".join(
+            f"{model} {tier['accepted']}/{tier['attempts']} accepted ({tier['accepted'] / tier['attempts']:.0%})"
+            for model, tier in self.as_dict().items()
+        )
+
+cascade_stats = CascadeStats()
 
+def _normalize(text: str) -> str:
+    return re.sub(r"\s+", " ", text).strip().lower()
 
-def extract_cv_data(text: str) -> list[cv]:
+def validate_candidates(candidates: list[cv], text: str) -> list[str]:
+    """Reasons to distrust an extraction of `text`: empty list means it passes."""
+    if not candidates:
+        return ["no candidate"]
+    problems = []
+    source = _normalize(text)
+    for candidate in candidates:
+        if not candidate.skills:
+            problems.append("no skills")
+        if candidate.years_of_exp is None:
+            # Fine for a graduate with no work history; a miss when the CV lists experience
+            if EXPERIENCE_RE.search(text):
+                problems.append("years_of_exp missing")
+        elif not 0 <= candidate.years_of_exp <= MAX_YEARS_OF_EXP:
+            problems.append(f"implausible years_of_exp {candidate.years_of_exp}")
+        if not candidate.name or _normalize(candidate.name) not in source:
+            problems.append(f"name {candidate.name!r} not in the text")
+    return problems
+
+def _as_tiers(llm) -> list[ChatGroq]:
+    if llm is None:
+        return initialize_cascade()
+    return llm if isinstance(llm, list) else [llm]
+
+
+def _fill_missing(fast: fast_extract.FastExtraction, candidates: list[cv]) -> list[cv]:
+    """Keep the fast-path fields and take only the unresolved ones from the LLM answer (fast guesses fill its gaps)."""
+    if len(candidates) != 1:
+        return candidates
+    llm_fields = candidates[0].model_dump()
+    return [cv(**{
+        field: (llm_fields[field] if llm_fields[field] not in (None, []) else getattr(fast, field))
+        if field in fast.missing else getattr(fast, field)
+        for field in cv.model_fields
+    })]
+
+def extract_cv_data(text: str, llm: Optional[ChatGroq | list[ChatGroq]] = None, use_cache: bool = True,
+                    fast_path: bool = FAST_PATH_ENABLED) -> list[cv]:
     logger.info("Extracting CV data from text")
 
-    """Extract data from the text using the language model."""
+    """
+    Extract data from the text using the language model (the cascade from initialize_cascade if llm is not given).
+
+    llm may also be a list of models, smallest first: each answer is checked
+    with validate_candidates and only a failing one is sent to the next model
+    (the last model's answer is kept either way).
+
+    Results are stored in the persistent extraction cache, so the same resume
+    text is only sent to the model once per prompt/model version. With
+    fast_path, fields found by the deterministic extractor are used as is and
+    the LLM is only called when some field is still unresolved.
+    """
+
+    cache = get_cache() if use_cache else None
+    key = ExtractionCache.make_key(text, extraction_version(fast_path))
+    if cache is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            logger.info("Extraction cache hit")
+            with metrics.span("json_parse"):
+                return data.model_validate_json(cached).candidates
+
+    with metrics.span("fast_path"):
+        fast = fast_extract.fast_extract(text) if fast_path else None
+    if fast is not None:
+        fast_extract.stats.record(avoided=not fast.missing)
+        if not fast.missing:
+            logger.info("All fields resolved without the LLM")
+            return [cv(**fast.model_dump(exclude={"missing"}))]
+        logger.info(f"Fields left to the LLM: {fast.missing}")
 
     prompt = create_prompt_template()
-    llm = initialize_llm()
+    tiers = _as_tiers(llm)
+
+    for tier, model in enumerate(tiers):
+        # creating a chain to extract structred ouput from the text using schema
+        runnable = prompt | model.with_structured_output(schema=data)
+        with metrics.span("llm", model=model.model_name):
+            response = rate_limiter.call(
+                model.model_name,
+                lambda: runnable.invoke({"text": text}),
+                tokens=count_tokens(SYSTEM_PROMPT + text) + COMPLETION_TOKENS_PER_CV,
+            )
+        if fast is not None:
+            response = data(candidates=_fill_missing(fast, response.candidates))
 
-    # creating a chain to extract structred ouput from the text using schema
-    runnable = prompt | llm.with_structured_output(schema=data)
-    response = runnable.invoke({"text": text})
+        problems = validate_candidates(response.candidates, text)
+        cascade_stats.record(model.model_name, accepted=not problems)
+        if not problems:
+            break
+        if tier < len(tiers) - 1:
+            logger.info(f"{model.model_name} answer escalated: {'; '.join(problems)}")
 
     logger.info(f"Extracted {len(response.candidates)} candidate(s) from the text")
+
+    if cache is not None:
+        cache.set(key, response.model_dump_json())
     
     return response.candidates  # returns the list of candidates
 
-def process_file(uploaded_files) -> str:
+def context_window(model_name: str) -> int:
+    return MODEL_CONTEXT_WINDOWS.get(model_name, DEFAULT_CONTEXT_WINDOW)
+
+def pack_texts(texts: list[str], token_budget: int = PACK_TOKEN_BUDGET,
+               context_window: Optional[int] = None) -> list[list[int]]:
+    """
+    Greedily group text indices so each group's text fits in token_budget (oversized texts go alone).
+
+    With context_window, a group must also fit the model's context together
+    with the prompt and the expected answer (COMPLETION_TOKENS_PER_CV per CV).
+    """
+    room = context_window - count_tokens(PACKED_PROMPT) - PACK_REQUEST_OVERHEAD if context_window else None
+    groups, current, used, needed = [], [], 0, 0
+    for index, text in enumerate(texts):
+        tokens = count_tokens(text)
+        if current and (used + tokens > token_budget
+                        or (room is not None and needed + tokens + COMPLETION_TOKENS_PER_CV > room)):
+            groups.append(current)
+            current, used, needed = [], 0, 0
+        current.append(index)
+        used += tokens
+        needed += tokens + COMPLETION_TOKENS_PER_CV
+    if current:
+        groups.append(current)
+    return groups
+
+def _packed_mapping_ok(response: packed_data, texts: list[str]) -> bool:
+    """Check every CV got exactly one candidate whose name (if any) appears in its own text."""
+    if len(response.candidates) != len(texts):
+        return False
+    if sorted(c.source_cv for c in response.candidates) != list(range(1, len(texts) + 1)):
+        return False
+    return all(
+        not c.name or c.name.lower() in texts[c.source_cv - 1].lower()
+        for c in response.candidates
+    )
+
+def extract_packed_cv_data(texts: list[str], llm: Optional[ChatGroq | list[ChatGroq]] = None) -> Optional[list[list[cv]]]:
+    logger.info(f"Extracting {len(texts)} CV(s) in one packed request")
+
+    """
+    Extract several CVs with a single structured-output call.
+
+    Returns one candidate list per input text (in order), or None when the
+    model's answer cannot be mapped back to the inputs, in which case callers
+    should fall back to extract_cv_data per text. Cached texts are not resent.
+    With a cascade the packed request goes to the first model and CVs whose
+    answer fails validation are re-extracted one by one with the others.
+    """
+
+    cache = get_cache()
+    keys = [ExtractionCache.make_key(text, EXTRACTION_VERSION) for text in texts]
+    results: list[Optional[list[cv]]] = [None] * len(texts)
+    for i, key in enumerate(keys):
+        cached = cache.get(key)
+        if cached is not None:
+            results[i] = data.model_validate_json(cached).candidates
+
+    fast: dict[int, fast_extract.FastExtraction] = {}
+    if FAST_PATH_ENABLED:
+        for i, result in enumerate(results):
+            if result is None:
+                fast[i] = fast_extract.fast_extract(texts[i])
+                fast_extract.stats.record(avoided=not fast[i].missing)
+                if not fast[i].missing:
+                    results[i] = [cv(**fast[i].model_dump(exclude={"missing"}))]
+
+    todo = [i for i, result in enumerate(results) if result is None]
+    tiers = _as_tiers(llm) if todo else []
+    if len(todo) == 1:
+        i = todo[0]
+        results[i] = extract_cv_data(texts[i], llm=tiers, use_cache=False, fast_path=False)
+        if i in fast:
+            results[i] = _fill_missing(fast[i], results[i])
+        cache.set(keys[i], data(candidates=results[i]).model_dump_json())
+    elif todo:
+        llm = tiers[0]
+        prompt = ChatPromptTemplate.from_messages([("system", PACKED_PROMPT), ("human", "{text}")])
+        packed_text = "\n\n".join(f"### CV {n}\n{texts[i]}" for n, i in enumerate(todo, start=1))
+
+        runnable = prompt | llm.with_structured_output(schema=packed_data)
+        with metrics.span("llm", model=llm.model_name, packed="true"):
+            response = rate_limiter.call(
+                llm.model_name,
+                lambda: runnable.invoke({"text": packed_text}),
+                tokens=count_tokens(PACKED_PROMPT + packed_text) + COMPLETION_TOKENS_PER_CV * len(todo),
+            )
+
+        if not _packed_mapping_ok(response, [texts[i] for i in todo]):
+            logger.warning(f"Packed response could not be mapped back to its {len(todo)} CVs")
+            return None
+
+        for candidate in response.candidates:
+            i = todo[candidate.source_cv - 1]
+            results[i] = [cv(**candidate.model_dump(exclude={"source_cv"}))]
+            if i in fast:
+                results[i] = _fill_missing(fast[i], results[i])
+
+            problems = validate_candidates(results[i], texts[i])
+            cascade_stats.record(llm.model_name, accepted=not problems)
+            if problems and len(tiers) > 1:
+                logger.info(f"{llm.model_name} packed answer for CV {candidate.source_cv} escalated: {'; '.join(problems)}")
+                results[i] = extract_cv_data(texts[i], llm=tiers[1:], use_cache=False, fast_path=False)
+                if i in fast:
+                    results[i] = _fill_missing(fast[i], results[i])
+            cache.set(keys[i], data(candidates=results[i]).model_dump_json())
+
+    return results
+
+def load_local_file(path: str) -> io.BytesIO:
+    """Read a file from disk into an in-memory object that process_file accepts like an upload."""
+    with open(path, "rb") as f:
+        local_file = io.BytesIO(f.read())
+    local_file.name = os.path.basename(path)
+    return local_file
+
+def iter_pages(uploaded_file) -> Iterator[str]:
+    logger.info(f"Parsing file in memory: {uploaded_file.name}")
+
+    """
+    Yield the text of the uploaded file page by page, straight from its buffer.
+
+    PDF pages are parsed one at a time and their layout objects released as
+    soon as the text is taken, so a long PDF is never held twice in memory.
+    Text files are yielded as a single page.
+    """
+
+    if uploaded_file.name.lower().endswith('.pdf'):
+        # Uploads are already in-memory file objects; only wrap raw bytes holders
+        stream = uploaded_file if hasattr(uploaded_file, "seek") else io.BytesIO(uploaded_file.getvalue())
+        stream.seek(0)
+        with pdfplumber.open(stream) as pdf:
+            for page in pdf.pages:
+                yield page.extract_text() or ""
+                page.close()
+    else:
+        yield uploaded_file.getvalue().decode("utf-8", errors="replace")
+
+def process_file(uploaded_files, compact: bool = True) -> str:
     logger.info(f"Processing file: {uploaded_files.name}")
 
-    """Process the uploaded file and return the text."""
+    """
+    Process the uploaded file and return the text.
 
-    with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(uploaded_files.name)[1]) as tmp_file:
-        tmp_file.write(uploaded_files.getvalue())
-        tmp_path = tmp_file.name
-    try:
-        if tmp_path.endswith('.pdf'):
-            loader = PDFPlumberLoader(tmp_path)
-            logger.info(f"Loaded PDF file: {tmp_path}")
+    By default the text is compacted (whitespace, running headers/footers and
+    boilerplate removed, trimmed to the token budget) before it reaches any prompt.
+    """
 
-        else:
-            loader = TextLoader(tmp_path)
-            logger.info(f"Loaded text file: {tmp_path}")
+    # Pages are read up front so parsing and compaction are timed separately
+    with metrics.span("parse"):
+        pages = list(iter_pages(uploaded_files))
 
-        documents = loader.load()
-        # return " ".join([doc.page_content for doc in documents])
-        text_content = " ".join([doc.page_content for doc in documents])
-        logger.info(f"Extracted text from file: {uploaded_files.name}")
+    if compact:
+        with metrics.span("compact"):
+            text_content = compact_pages(pages)
+        logger.info(f"Compacted text to ~{count_tokens(text_content)} tokens: {uploaded_files.name}")
         return text_content
-    
-    finally:
-        logger.info(f"Deleting temporary file: {tmp_path}")
-        os.unlink(tmp_path)
 
+    text_content = " ".join(pages)
+    logger.info(f"Extracted text from file: {uploaded_files.name}")
+    return text_content
+
+@metrics.timed("render", view="candidates")
 def display_candidates_info(candidates_list: list[cv]):
     logger.info(f"Displaying information for {len(candidates_list)} candidate(s)")
 
     """Display the extracted candidates' information in a table."""
-    
-    logger.debug(f"Candidate list: {candidates_list}")
 
     data = []
     for candidate in candidates_list:
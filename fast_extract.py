@@ -0,0 +1,282 @@
+import re
+import threading
+from collections import deque
+from datetime import date
+from typing import Iterator, Optional
+from pydantic import BaseModel
+
+# Skills recognised without the LLM (matched case-insensitively on word boundaries)
+SKILL_DICTIONARY = [
+    "Python", "Java", "JavaScript", "TypeScript", "C++", "C#", "Golang", "Rust", "Ruby", "PHP",
+    "Kotlin", "Swift", "Scala", "MATLAB", "Perl", "Bash", "Shell Scripting", "SQL", "NoSQL",
+    "PostgreSQL", "MySQL", "SQLite", "Oracle", "MongoDB", "Redis", "Cassandra", "Elasticsearch",
+    "DynamoDB", "Snowflake", "BigQuery", "HTML", "CSS", "Sass", "React", "React.js", "Angular",
+    "Vue.js", "Next.js", "Node.js", "Express.js", "Django", "Flask", "FastAPI", "Spring Boot",
+    "Hibernate", ".NET", "ASP.NET", "Ruby on Rails", "GraphQL", "RESTful", "REST APIs", "gRPC",
+    "AWS", "Azure", "GCP", "Google Cloud", "Docker", "Kubernetes", "Terraform", "Ansible", "Jenkins",
+    "GitHub Actions", "CI/CD", "Git", "Linux", "Kafka", "RabbitMQ", "Spark", "Hadoop", "Airflow",
+    "dbt", "Pandas", "NumPy", "SciPy", "scikit-learn", "TensorFlow", "PyTorch", "Keras",
+    "Machine Learning", "Deep Learning", "NLP", "Computer Vision", "LLM", "LangChain",
+    "Data Analysis", "Data Engineering", "Tableau", "Power BI", "Microsoft Excel", "Microservices",
+    "Agile", "Scrum", "JIRA", "Selenium", "Jest", "Pytest", "Figma", "Streamlit",
+]
+
+# Certifications recognised anywhere in the text
+CERTIFICATION_DICTIONARY = [
+    "AWS Certified Cloud Practitioner", "AWS Certified Solutions Architect", "AWS Certified Developer",
+    "AWS Certified SysOps Administrator", "AWS Certified DevOps Engineer", "AWS Certified Data Engineer",
+    "AWS Certified Machine Learning", "Azure Fundamentals", "Azure Administrator Associate",
+    "Azure Developer Associate", "Azure Solutions Architect Expert", "Google Cloud Professional",
+    "Google Associate Cloud Engineer", "Certified Kubernetes Administrator", "CKA",
+    "Certified Kubernetes Application Developer", "CKAD", "MongoDB Developer Associate",
+    "Oracle Certified Professional", "PMP", "Certified ScrumMaster", "CSM", "CISSP", "CompTIA Security+",
+    "CompTIA Network+", "CompTIA A+", "Terraform Associate", "TensorFlow Developer Certificate",
+]
+
+# Bump when the rules below change, so cached extractions made with the old rules are not reused
+FAST_PATH_VERSION = 3
+
+SECTION_HEADER_RE = re.compile(
+    r"^\s*(summary|profile|objective|about me|(work |professional )?experience|employment( history)?|"
+    r"education|(technical |core )?skills|projects|publications|awards|achievements|languages|"
+    r"interests|hobbies|references|volunteering|(professional )?certifi(cations?|cates?))\s*:?\s*$",
+    re.IGNORECASE,
+)
+CERT_HEADER_RE = re.compile(r"^\s*(professional\s+)?certifi(cations?|cates?)\s*:?\s*$", re.IGNORECASE)
+CERT_LINE_RE = re.compile(r"\b(certified|certification|certificate)\b", re.IGNORECASE)
+SKILLS_HEADER_RE = re.compile(r"^\s*(technical |core |key )?skills\s*(:\s*(?P<inline>.*))?$", re.IGNORECASE)
+SKILL_SEPARATOR_RE = re.compile(r"\s*[,;|•·]\s*")
+YEARS_RE = re.compile(r"\b(\d{1,2})\s*\+?\s*(?:years?|yrs?)\b(?:\s+of)?(?:\s+\w+){0,3}?\s+experience", re.IGNORECASE)
+# "Experience: 7 years", "Total experience - 7+ yrs"
+EXPERIENCE_YEARS_RE = re.compile(r"\bexperience\s*[:\-]\s*(\d{1,2})\s*\+?\s*(?:years?|yrs?)\b", re.IGNORECASE)
+# Only "since YYYY" about the career itself, not "maintained since 2019" in a project description
+SINCE_RE = re.compile(
+    r"\b(?:experience|working|worked|career|professional|industry)\b[^.\n]{0,40}?\bsince\s+((?:19|20)\d{2})\b",
+    re.IGNORECASE,
+)
+NAME_RE = re.compile(r"^[A-Z][a-zA-Z'\-]+(?:\s+[A-Z][a-zA-Z'\-\.]*){1,3}$")
+# Job titles look like names ("Senior Data Engineer"); a line with any of these words is not one
+TITLE_WORDS_RE = re.compile(
+    r"\b(senior|junior|lead|principal|staff|chief|head|intern|engineer|developer|programmer|manager|"
+    r"analyst|scientist|consultant|designer|architect|administrator|specialist|director|officer|"
+    r"associate|coordinator|executive|technician|researcher|student|graduate|freelance|data|software|"
+    r"curriculum|vitae|resume)\b",
+    re.IGNORECASE,
+)
+# Headings, contact blocks and degrees that also look like names ("Contact Information", "Bachelor Of Technology")
+NOT_NAME_WORDS_RE = re.compile(
+    r"\b(summary|profile|objective|career|contact|information|info|personal|details|about|address|"
+    r"phone|email|bachelor|bachelors|master|masters|degree|diploma|technology|science|arts|university|"
+    r"college|institute|school|of|and|the|in|for|page|portfolio|professional|experience|education|"
+    r"skills|projects|certifications?|references)\b",
+    re.IGNORECASE,
+)
+BULLET_RE = re.compile(r"^[\s\-\*•●▪>]+")
+
+
+class AhoCorasick:
+    """Aho–Corasick automaton for finding many dictionary phrases in one pass over the text."""
+
+    def __init__(self, phrases: list[str]):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list[str]] = [[]]
+        for phrase in phrases:
+            self._add(phrase)
+        self._build()
+
+    def _add(self, phrase: str):
+        state = 0
+        for char in phrase.lower():
+            if char not in self._goto[state]:
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+                self._goto[state][char] = len(self._goto) - 1
+            state = self._goto[state][char]
+        self._out[state].append(phrase)
+
+    def _build(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def find(self, text: str) -> Iterator[tuple[int, str]]:
+        """Yield (start, phrase) for every dictionary phrase that occurs as a whole word."""
+        lowered = text.lower()
+        state = 0
+        for i, char in enumerate(lowered):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for phrase in self._out[state]:
+                start = i - len(phrase) + 1
+                before = lowered[start - 1] if start > 0 else " "
+                after = lowered[i + 1] if i + 1 < len(lowered) else " "
+                if not (before.isalnum() or after.isalnum() or after in "+#"):
+                    yield start, phrase
+
+
+class FastExtraction(BaseModel):
+    """Fields found deterministically, and the cv fields that still need the LLM."""
+    name: Optional[str] = None
+    skills: Optional[list[str]] = None
+    certifications: Optional[list[str]] = None
+    years_of_exp: Optional[int] = None
+    missing: list[str] = []
+
+
+class FastPathStats:
+    """Counts how many LLM extraction calls the fast path made unnecessary."""
+
+    def __init__(self):
+        self.llm_calls_avoided = 0
+        self.llm_calls = 0
+        self._lock = threading.Lock()
+
+    def record(self, avoided: bool):
+        with self._lock:
+            if avoided:
+                self.llm_calls_avoided += 1
+            else:
+                self.llm_calls += 1
+
+    def as_dict(self) -> dict[str, int]:
+        return {"llm_calls_avoided": self.llm_calls_avoided, "llm_calls": self.llm_calls}
+
+
+stats = FastPathStats()
+_skills = AhoCorasick(SKILL_DICTIONARY)
+_certifications = AhoCorasick(CERTIFICATION_DICTIONARY)
+
+
+def _looks_like_name(line: str) -> bool:
+    return bool(
+        NAME_RE.match(line)
+        and not TITLE_WORDS_RE.search(line)
+        and not NOT_NAME_WORDS_RE.search(line)
+        and not SECTION_HEADER_RE.match(line)
+    )
+
+
+def _find_name(lines: list[str]) -> tuple[Optional[str], bool]:
+    """
+    The candidate's name and whether it is a confident match.
+
+    Only a first line that looks like a name (and not a job title, heading
+    or degree) is confident; a later name-like line is kept as a fallback
+    guess for the LLM answer.
+    """
+    for i, line in enumerate(lines[:5]):
+        line = line.strip()
+        if _looks_like_name(line):
+            return line, i == 0
+    return None, False
+
+
+def _find_skills_section(lines: list[str]) -> Optional[list[str]]:
+    """Items listed under a Skills heading (or on a "Skills: ..." line); None when there is no such section."""
+    items: Optional[list[str]] = None
+    in_section = False
+    for line in lines:
+        stripped = line.strip()
+        header = SKILLS_HEADER_RE.match(stripped)
+        if header:
+            items = items or []
+            # "Skills: a, b, c" is the whole section; a bare heading lists them on the lines below
+            in_section = not header.group("inline")
+            stripped = header.group("inline") or ""
+        elif in_section and SECTION_HEADER_RE.match(stripped):
+            in_section = False
+            continue
+        elif not in_section:
+            continue
+        if stripped:
+            items.extend(item for item in SKILL_SEPARATOR_RE.split(BULLET_RE.sub("", stripped)) if item)
+    return items
+
+
+def _dictionary_skills(items: list[str]) -> Optional[list[str]]:
+    """The items in their dictionary spelling, or None if any item is not a known skill."""
+    canonical = {phrase.lower(): phrase for phrase in SKILL_DICTIONARY}
+    found = [canonical.get(item.lower().rstrip(".")) for item in items]
+    if not found or None in found:
+        return None
+    return list(dict.fromkeys(found))
+
+
+def _find_certifications(lines: list[str]) -> tuple[list[str], bool]:
+    """Certification lines, and whether the CV has a certifications section at all."""
+    found: list[str] = []
+    has_section = False
+    in_section = False
+    for line in lines:
+        stripped = line.strip()
+        if CERT_HEADER_RE.match(stripped):
+            has_section = in_section = True
+            continue
+        if in_section and SECTION_HEADER_RE.match(stripped):
+            in_section = False
+        if stripped and (in_section or CERT_LINE_RE.search(stripped)):
+            found.append(BULLET_RE.sub("", stripped))
+
+    for _, phrase in _certifications.find("\n".join(lines)):
+        if not any(phrase.lower() in line.lower() for line in found):
+            found.append(phrase)
+    return list(dict.fromkeys(found)), has_section
+
+
+def _find_years(text: str) -> Optional[int]:
+    mentions = {int(m.group(1)) for pattern in (YEARS_RE, EXPERIENCE_YEARS_RE) for m in pattern.finditer(text)}
+    if len(mentions) == 1:
+        return mentions.pop()
+    if not mentions:
+        since = [int(m.group(1)) for m in SINCE_RE.finditer(text)]
+        if len(set(since)) == 1 and since[0] <= date.today().year:
+            return date.today().year - since[0]
+    # Several different figures (or none) is too ambiguous to settle without the LLM
+    return None
+
+
+def fast_extract(text: str) -> FastExtraction:
+    """
+    Fill as many cv fields as possible with regexes and dictionary matching.
+
+    Skills only count as resolved when the CV has a Skills section and every
+    item in it is a dictionary skill; otherwise the dictionary hits are kept
+    as a fallback for an empty LLM answer and the field stays in `missing`.
+    """
+    lines = [line for line in text.splitlines() if line.strip()]
+
+    section = _find_skills_section(lines)
+    section_skills = _dictionary_skills(section) if section else None
+    skills = section_skills or list(dict.fromkeys(phrase for _, phrase in _skills.find(text))) or None
+    certifications, has_cert_section = _find_certifications(lines)
+    name, name_resolved = _find_name(lines)
+
+    result = FastExtraction(
+        name=name,
+        skills=skills,
+        certifications=certifications or None,
+        years_of_exp=_find_years(text),
+    )
+
+    # Certifications are settled when listed, or when the CV clearly has none
+    certifications_resolved = bool(certifications) or not (has_cert_section or CERT_LINE_RE.search(text))
+    result.missing = [
+        field for field, resolved in (
+            ("name", name_resolved),
+            ("skills", section_skills is not None),
+            ("certifications", certifications_resolved),
+            ("years_of_exp", result.years_of_exp is not None),
+        )
+        if not resolved
+    ]
+    return result
@@ -0,0 +1,64 @@
+from typing import Iterable, Optional
+import numpy as np
+import pandas as pd
+from sklearn.feature_extraction.text import TfidfVectorizer
+from scoring import top_k_indices
+
+# Keep tokens like "c++", "c#", "node.js" and "ci/cd" whole
+TOKEN_PATTERN = r"[\w+#]+(?:[./-][\w+#]+)*"
+
+# The title says more about the role than any single line of the description
+TITLE_WEIGHT = 3
+# Only the start of long descriptions is indexed; requirements are rarely buried further down
+DESCRIPTION_CHARS = 4000
+
+
+def job_documents(jobs: pd.DataFrame) -> list[str]:
+    """One text per posting: the title (repeated to weight it) followed by the description."""
+    empty = pd.Series("", index=jobs.index)
+    titles = jobs["title"].fillna("").astype(str) if "title" in jobs else empty
+    descriptions = jobs["description"].fillna("").astype(str).str[:DESCRIPTION_CHARS] if "description" in jobs else empty
+    return ((titles + " ") * TITLE_WEIGHT + descriptions).tolist()
+
+
+def resume_query(skills: Optional[Iterable[str]], certifications: Optional[Iterable[str]] = None) -> str:
+    return " ".join(list(skills or []) + list(certifications or []))
+
+
+class JobIndex:
+    """
+        Sparse TF-IDF index over a set of job postings.
+
+        Building the index tokenizes every posting once; scoring a resume is
+        then a single sparse matrix-vector product over all postings, with no
+        LLM calls, so re-ranking for another resume takes milliseconds.
+    """
+
+    def __init__(self, jobs: pd.DataFrame):
+        self.jobs = jobs
+        self.vectorizer = TfidfVectorizer(token_pattern=TOKEN_PATTERN, stop_words="english", sublinear_tf=True)
+        try:
+            self.matrix = self.vectorizer.fit_transform(job_documents(jobs)) if len(jobs) else None
+        except ValueError:  # every posting was empty or stop words only
+            self.matrix = None
+
+    def scores(self, query: str) -> np.ndarray:
+        """Cosine similarity between every posting and the query text."""
+        if self.matrix is None or not query.strip():
+            return np.zeros(len(self.jobs))
+        return (self.matrix @ self.vectorizer.transform([query]).T).toarray().ravel()
+
+    def rank(self, skills: Optional[Iterable[str]], certifications: Optional[Iterable[str]] = None,
+             top_k: Optional[int] = None) -> pd.DataFrame:
+        """Postings sorted by match, with a 0-100 `match_score` column (top_k rows if given)."""
+        scores = self.scores(resume_query(skills, certifications))
+        order = top_k_indices(scores, top_k if top_k is not None else len(scores))
+        ranked = self.jobs.iloc[order].copy()
+        ranked.insert(0, "match_score", np.round(scores[order] * 100, 1))
+        return ranked.reset_index(drop=True)
+
+
+def rank_jobs(jobs: pd.DataFrame, skills: Optional[Iterable[str]], certifications: Optional[Iterable[str]] = None,
+              top_k: Optional[int] = None) -> pd.DataFrame:
+    """Rank postings against a resume's skills and certifications."""
+    return JobIndex(jobs).rank(skills, certifications, top_k)
@@ -0,0 +1,209 @@
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Callable, Iterator, Optional
+import pandas as pd
+from jobspy import scrape_jobs
+from job_store import get_job_store
+from parallel import run_bounded
+
+logger = logging.getLogger(__name__)
+
+# How long a search result is served as fresh, and how much longer it may be served stale
+# while it refreshes in the background (overridable through the environment)
+JOB_CACHE_TTL = float(os.getenv("JOB_CACHE_TTL", "900"))
+JOB_CACHE_MAX_STALE = float(os.getenv("JOB_CACHE_MAX_STALE", "3600"))
+# Searches kept in memory (least recently used are dropped first)
+JOB_CACHE_MAX_ENTRIES = int(os.getenv("JOB_CACHE_MAX_ENTRIES", "128"))
+# Seconds a caller waits for a search that is not cached before giving up on it
+JOB_SEARCH_TIMEOUT = float(os.getenv("JOB_SEARCH_TIMEOUT", "120"))
+# Seconds a single site may take before it is reported as timed out
+SITE_TIMEOUT = float(os.getenv("JOB_SITE_TIMEOUT", "45"))
+
+
+def normalize_search_params(site_name: list[str], search_term: str, location: str,
+                            results_wanted: int, hours_old: int, country_indeed: str) -> dict:
+    """Canonical form of a job search, so equivalent searches share one cache entry."""
+    return {
+        "site_name": tuple(sorted({site.strip().lower() for site in site_name})),
+        "search_term": " ".join(search_term.split()).lower(),
+        "location": " ".join(location.split()).lower(),
+        "results_wanted": int(results_wanted),
+        "hours_old": int(hours_old),
+        "country_indeed": country_indeed.strip().lower(),
+    }
+
+
+def fetch_jobs(params: dict) -> pd.DataFrame:
+    """Run the multi-site scrape for normalized search parameters."""
+    return scrape_jobs(
+        site_name=list(params["site_name"]),
+        search_term=params["search_term"],
+        google_search_term=f"{params['search_term']} jobs near {params['location']}",
+        location=params["location"],
+        results_wanted=params["results_wanted"],
+        hours_old=params["hours_old"],
+        country_indeed=params["country_indeed"],
+    )
+
+
+def fetch_stored_jobs(params: dict) -> pd.DataFrame:
+    """Sync the persistent job store for a search (scraping only what is new) and read the postings from it."""
+    return get_job_store().refresh(params, fetch_jobs)
+
+
+class JobSearchCache:
+    """
+        Process-wide TTL cache for job searches with stale-while-revalidate.
+
+        Fresh entries are returned as is. Stale entries (older than `ttl` but
+        within `max_stale`) are returned immediately while a background refresh
+        runs; anything older, or missing, is fetched before returning.
+        Concurrent requests for the same search share a single fetch. At most
+        `max_entries` searches are kept, least recently used dropped first.
+    """
+
+    def __init__(self, ttl: float = JOB_CACHE_TTL, max_stale: float = JOB_CACHE_MAX_STALE,
+                 max_entries: int = JOB_CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self.max_entries = max_entries
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple, tuple[float, pd.DataFrame]] = OrderedDict()
+        self._inflight: dict[tuple, Future] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(params: dict) -> tuple:
+        return tuple(sorted(params.items()))
+
+    def get(self, params: dict, fetch: Callable[[dict], pd.DataFrame] = fetch_stored_jobs,
+            timeout: Optional[float] = JOB_SEARCH_TIMEOUT) -> tuple[pd.DataFrame, dict]:
+        """
+            Return (jobs, status) where status has 'state' (fresh/stale/miss), 'age' and 'refreshing'.
+
+            A miss waits at most `timeout` seconds for the fetch and then raises
+            TimeoutError; the fetch carries on and fills the cache when it ends.
+        """
+        key = self.make_key(params)
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            age = now - entry[0] if entry else None
+            if entry:
+                self._entries.move_to_end(key)
+
+            if entry and age < self.ttl:
+                self.hits += 1
+                return entry[1].copy(), {"state": "fresh", "age": age, "refreshing": key in self._inflight}
+
+            if entry and age < self.ttl + self.max_stale:
+                self.stale_hits += 1
+                self._refresh(key, params, fetch)
+                return entry[1].copy(), {"state": "stale", "age": age, "refreshing": True}
+
+            self.misses += 1
+            future = self._refresh(key, params, fetch)
+
+        try:
+            jobs = future.result(timeout=timeout)
+        except FutureTimeoutError:
+            raise TimeoutError(f"Job search timed out after {timeout:g}s") from None
+        return jobs.copy(), {"state": "miss", "age": 0.0, "refreshing": False}
+
+    def _refresh(self, key: tuple, params: dict, fetch: Callable[[dict], pd.DataFrame]) -> Future:
+        # Caller holds the lock; reuse a fetch that is already running for this search
+        if key in self._inflight:
+            return self._inflight[key]
+
+        future: Future = Future()
+
+        def _run():
+            try:
+                jobs = fetch(params)
+            except Exception as e:
+                logger.warning(f"Job search refresh failed: {e}")
+                with self._lock:
+                    self._inflight.pop(key, None)
+                future.set_exception(e)
+                return
+            with self._lock:
+                self._entries[key] = (time.time(), jobs)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                self._inflight.pop(key, None)
+            future.set_result(jobs)
+
+        # One thread per distinct search rather than a shared pool: the fetch starts right away (so
+        # a caller's timeout never includes time spent queued) and a hung scrape only ties up itself
+        future.set_running_or_notify_cancel()
+        threading.Thread(target=_run, name="job-search", daemon=True).start()
+        self._inflight[key] = future
+        return future
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "refreshing": len(self._inflight),
+            }
+
+
+job_cache = JobSearchCache()
+
+
+def search_jobs(site_name: list[str], search_term: str, location: str, results_wanted: int,
+                hours_old: int, country_indeed: str) -> tuple[pd.DataFrame, dict]:
+    """Cached job search shared by every session in the process."""
+    params = normalize_search_params(site_name, search_term, location, results_wanted, hours_old, country_indeed)
+    return job_cache.get(params)
+
+
+def search_jobs_by_site(site_name: list[str], search_term: str, location: str, results_wanted: int,
+                        hours_old: int, country_indeed: str,
+                        timeout: float = SITE_TIMEOUT) -> Iterator[tuple[str, Optional[pd.DataFrame], Optional[dict], Optional[Exception]]]:
+    """
+        Search every site in its own worker and yield (site, jobs, status, error) as each one finishes.
+
+        Each site has its own cache entry and timeout, so a slow or failing
+        site only costs its own results.
+    """
+    params = normalize_search_params(site_name, search_term, location, results_wanted, hours_old, country_indeed)
+    per_site = [{**params, "site_name": (site,)} for site in params["site_name"]]
+
+    # Each wait is bounded by get(timeout=...), which also lets the fetch finish into the cache
+    for site_params, result, error in run_bounded(
+        lambda site_params: job_cache.get(site_params, timeout=timeout),
+        per_site,
+        max_workers=len(per_site),
+    ):
+        site = site_params["site_name"][0]
+        if error:
+            yield site, None, None, error
+        else:
+            yield site, result[0], result[1], None
+
+
+def describe_cache_status(status: dict) -> str:
+    """Short human-readable note about where a search result came from."""
+    if status["state"] == "miss":
+        return "Fresh search results"
+    minutes = status["age"] / 60
+    note = f"Served from cache ({minutes:.0f} min old)" if minutes >= 1 else f"Served from cache ({status['age']:.0f}s old)"
+    if status["refreshing"]:
+        note += " · refreshing in the background"
+    return note
@@ -0,0 +1,219 @@
+import json
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Where scraped postings are kept (overridable through the environment)
+DEFAULT_STORE_PATH = os.getenv("JOB_STORE_PATH", os.path.join(".cache", "jobs.sqlite3"))
+
+# Query-string parameters that only track the click and do not identify the posting
+TRACKING_PARAMS = {"refid", "trackingid", "trk", "from", "src", "source", "position", "pagenum"}
+
+
+def normalize_job_url(url: str) -> str:
+    """Lowercase scheme/host, drop fragments, tracking parameters and trailing slashes."""
+    parts = urlsplit(url.strip())
+    query = [
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in TRACKING_PARAMS and not k.lower().startswith("utm_")
+    ]
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/"), urlencode(sorted(query)), ""))
+
+
+def job_key(row: dict) -> Optional[str]:
+    """Unique key for a posting: (site, id) when the scraper gives an id, the normalized URL otherwise."""
+    if row.get("site") and isinstance(row.get("id"), str) and row["id"]:
+        return f"{row['site']}:{row['id']}"
+    if isinstance(row.get("job_url"), str) and row["job_url"]:
+        return normalize_job_url(row["job_url"])
+    return None
+
+
+def query_key(params: dict) -> str:
+    """
+        Identity of a search for sync tracking.
+
+        `hours_old` and `results_wanted` are left out: they change how much is
+        fetched, not which postings belong to the search.
+    """
+    return json.dumps({k: v for k, v in params.items() if k not in ("hours_old", "results_wanted")}, sort_keys=True)
+
+
+class JobStore:
+    """
+        Persistent, deduplicated store of scraped job postings.
+
+        Postings are upserted on a unique (site, id) / normalized URL key and
+        linked to the searches that returned them. Each search remembers when it
+        was last synced, how far back that sync reached and with how many results
+        per site, so a refresh only scrapes postings newer than the last sync by
+        narrowing `hours_old` (when it does not want more results than that).
+    """
+
+    def __init__(self, path: str = DEFAULT_STORE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " key TEXT PRIMARY KEY,"
+            " site TEXT,"
+            " date_posted TEXT,"
+            " first_seen REAL NOT NULL,"
+            " last_seen REAL NOT NULL,"
+            " data TEXT NOT NULL);"
+            "CREATE TABLE IF NOT EXISTS query_jobs ("
+            " query TEXT NOT NULL,"
+            " key TEXT NOT NULL,"
+            " PRIMARY KEY (query, key));"
+            "CREATE TABLE IF NOT EXISTS syncs ("
+            " query TEXT PRIMARY KEY,"
+            " last_sync REAL NOT NULL,"
+            " covered_from REAL NOT NULL,"
+            " results_wanted INTEGER NOT NULL DEFAULT 0);"
+        )
+        # Stores created before results_wanted was tracked: 0 means "never narrow"
+        columns = [row[1] for row in self._conn.execute("PRAGMA table_info(syncs)")]
+        if "results_wanted" not in columns:
+            self._conn.execute("ALTER TABLE syncs ADD COLUMN results_wanted INTEGER NOT NULL DEFAULT 0")
+        self._conn.commit()
+
+    def upsert(self, jobs: pd.DataFrame, query: str) -> int:
+        """Insert or update postings from a scrape result; returns how many were new."""
+        if jobs.empty:
+            return 0
+        now = time.time()
+        rows = json.loads(jobs.to_json(orient="records", date_format="iso"))
+        new = 0
+        with self._lock:
+            for row in rows:
+                key = job_key(row)
+                if key is None:
+                    continue
+                date_posted = row["date_posted"][:10] if isinstance(row.get("date_posted"), str) else None
+                # INSERT OR IGNORE + UPDATE rather than UPSERT ... RETURNING, which needs SQLite 3.35
+                cursor = self._conn.execute(
+                    "INSERT OR IGNORE INTO jobs (key, site, date_posted, first_seen, last_seen, data) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, row.get("site"), date_posted, now, now, json.dumps(row)),
+                )
+                if cursor.rowcount:
+                    new += 1
+                else:
+                    self._conn.execute(
+                        "UPDATE jobs SET last_seen = ?, data = ?, date_posted = COALESCE(?, date_posted) WHERE key = ?",
+                        (now, json.dumps(row), date_posted, key),
+                    )
+                self._conn.execute("INSERT OR IGNORE INTO query_jobs (query, key) VALUES (?, ?)", (query, key))
+            self._conn.commit()
+        return new
+
+    def last_sync(self, query: str) -> Optional[tuple[float, float, int]]:
+        """(last_sync, covered_from, results_wanted) for a search, or None if it was never synced."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT last_sync, covered_from, results_wanted FROM syncs WHERE query = ?", (query,)
+            ).fetchone()
+
+    def mark_synced(self, query: str, synced_at: float, covered_from: float, results_wanted: int):
+        """
+            Record a sync that fetched up to results_wanted postings per site posted since covered_from.
+
+            The stored coverage is only extended when the new window reaches back
+            to the previous sync, and then holds the smaller of the two
+            results_wanted; otherwise there is a gap and coverage restarts at the
+            new window.
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO syncs (query, last_sync, covered_from, results_wanted) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(query) DO UPDATE SET last_sync = excluded.last_sync, "
+                "covered_from = CASE WHEN excluded.covered_from <= syncs.last_sync "
+                "THEN MIN(syncs.covered_from, excluded.covered_from) ELSE excluded.covered_from END, "
+                "results_wanted = CASE WHEN excluded.covered_from <= syncs.last_sync "
+                "THEN MIN(syncs.results_wanted, excluded.results_wanted) ELSE excluded.results_wanted END",
+                (query, synced_at, covered_from, results_wanted),
+            )
+            self._conn.commit()
+
+    def query(self, query: str, hours_old: int, results_wanted: Optional[int] = None) -> pd.DataFrame:
+        """
+            Stored postings for a search that were posted (or first seen) within the last hours_old hours.
+
+            Like the scraper, at most results_wanted postings per site are returned (newest first).
+        """
+        cutoff = time.time() - hours_old * 3600
+        cutoff_date = (datetime.now() - timedelta(hours=hours_old)).date().isoformat()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT jobs.data FROM jobs JOIN query_jobs ON query_jobs.key = jobs.key "
+                "WHERE query_jobs.query = ? AND "
+                "(jobs.date_posted >= ? OR (jobs.date_posted IS NULL AND jobs.first_seen >= ?)) "
+                "ORDER BY jobs.site, jobs.date_posted DESC",
+                (query, cutoff_date, cutoff),
+            ).fetchall()
+
+        jobs = pd.DataFrame([json.loads(data) for (data,) in rows])
+        if results_wanted is not None and "site" in jobs:
+            jobs = jobs.groupby("site", sort=False, dropna=False).head(results_wanted).reset_index(drop=True)
+        if "date_posted" in jobs:
+            jobs["date_posted"] = pd.to_datetime(jobs["date_posted"], errors="coerce").dt.date
+        return jobs
+
+    def refresh(self, params: dict, fetch: Callable[[dict], pd.DataFrame]) -> pd.DataFrame:
+        """
+            Bring the store up to date for a search and return its postings.
+
+            If the search was synced before, that sync already reaches back
+            `hours_old` and it fetched at least `results_wanted` postings per
+            site, only the hours since the last sync are scraped. A search for
+            more results than before scrapes the whole window again.
+        """
+        query = query_key(params)
+        now = time.time()
+        requested_from = now - params["hours_old"] * 3600
+
+        fetch_params = dict(params)
+        synced = self.last_sync(query)
+        if synced and synced[1] <= requested_from and synced[2] >= params["results_wanted"]:
+            # Round up and add an hour of overlap so nothing posted around the last sync is missed
+            fetch_params["hours_old"] = min(params["hours_old"], math.ceil((now - synced[0]) / 3600) + 1)
+
+        new = self.upsert(fetch(fetch_params), query)
+        self.mark_synced(query, now, now - fetch_params["hours_old"] * 3600, params["results_wanted"])
+        logger.info(f"Job store sync fetched {fetch_params['hours_old']}h of postings, {new} new")
+        return self.query(query, params["hours_old"], params.get("results_wanted"))
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "jobs": self._conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0],
+                "searches": self._conn.execute("SELECT COUNT(*) FROM syncs").fetchone()[0],
+            }
+
+
+_store: Optional[JobStore] = None
+_store_lock = threading.Lock()
+
+
+def get_job_store() -> JobStore:
+    """Process-wide job store, opened on first use."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = JobStore()
+            logger.info(f"Opened job store at {_store.path}")
+        return _store
@@ -0,0 +1,78 @@
+import os
+import threading
+from typing import Optional
+import httpx
+from groq import Groq
+from langchain_groq import ChatGroq
+
+# Connection pool shared by every Groq client in the process
+MAX_CONNECTIONS = int(os.getenv("GROQ_MAX_CONNECTIONS", "20"))
+KEEPALIVE_EXPIRY = 60.0
+# Retries and pacing are done by rate_limiter, which sees every model's traffic; the SDK's own
+# retries would sleep outside the scheduler and hold a slot other requests could use
+SDK_MAX_RETRIES = 0
+
+_lock = threading.Lock()
+_http_client: Optional[httpx.Client] = None
+_groq_clients: dict[tuple, Groq] = {}
+_chat_models: dict[tuple, ChatGroq] = {}
+
+
+def get_groq_api_key() -> Optional[str]:
+    """GROQ_API_KEY from the environment, falling back to Streamlit secrets; None when neither has it."""
+    api_key = os.getenv("GROQ_API_KEY")
+    if api_key is None:
+        try:
+            import streamlit as st
+            api_key = st.secrets["GROQ_API_KEY"]
+        except Exception:
+            api_key = None
+    return api_key
+
+
+def get_http_client() -> httpx.Client:
+    """Process-wide pooled HTTP client, so keep-alive and TLS sessions survive reruns and pages."""
+    global _http_client
+    with _lock:
+        if _http_client is None:
+            _http_client = httpx.Client(
+                limits=httpx.Limits(
+                    max_connections=MAX_CONNECTIONS,
+                    max_keepalive_connections=MAX_CONNECTIONS,
+                    keepalive_expiry=KEEPALIVE_EXPIRY,
+                ),
+                timeout=httpx.Timeout(60.0, connect=10.0),
+            )
+        return _http_client
+
+
+def get_groq_client(api_key: Optional[str]) -> Groq:
+    """Shared raw Groq client for the given key, built on the pooled HTTP client."""
+    http_client = get_http_client()
+    key = (api_key, os.getenv("GROQ_BASE_URL"))
+    with _lock:
+        if key not in _groq_clients:
+            _groq_clients[key] = Groq(api_key=api_key, base_url=key[1], max_retries=SDK_MAX_RETRIES,
+                                         http_client=http_client)
+        return _groq_clients[key]
+
+
+def get_chat_groq(groq_api_key: Optional[str], model_name: str, temperature: float,
+                  max_tokens: Optional[int] = None, timeout: Optional[float] = None) -> ChatGroq:
+    """Shared ChatGroq for the given model and parameters, built on the pooled HTTP client."""
+    http_client = get_http_client()
+    base_url = os.getenv("GROQ_BASE_URL")
+    key = (groq_api_key, base_url, model_name, temperature, max_tokens, timeout)
+    with _lock:
+        if key not in _chat_models:
+            _chat_models[key] = ChatGroq(
+                groq_api_key=groq_api_key,
+                groq_api_base=base_url,
+                model_name=model_name,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                timeout=timeout,
+                max_retries=SDK_MAX_RETRIES,
+                http_client=http_client,
+            )
+        return _chat_models[key]
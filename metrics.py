@@ -0,0 +1,177 @@
+"""
+        Lightweight timing spans for the CV pipeline
+
+        with metrics.span("llm", model="llama-3.3-70b-versatile"):
+            response = runnable.invoke(...)
+
+        @metrics.timed("score")
+        def calculate_match_scores(...): ...
+
+        Durations are aggregated into per-stage latency histograms and exported
+        in the Prometheus text format, either to a file or on a local endpoint:
+
+        CV_METRICS=1                  record spans (off by default; a disabled span is a shared no-op)
+        CV_METRICS_PORT=9464          also serve http://localhost:9464/metrics
+        CV_METRICS_FILE=metrics.prom  also write the histograms to this file at exit
+"""
+
+import atexit
+import contextlib
+import functools
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+METRIC_NAME = "cv_pipeline_stage_seconds"
+# Upper bounds (seconds) of the latency buckets; LLM calls need the long tail
+BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+_NOOP = contextlib.nullcontext()
+
+
+class Histogram:
+    """Cumulative latency histogram per label set, safe to observe from many threads."""
+
+    def __init__(self, buckets: tuple[float, ...] = BUCKETS):
+        self.buckets = buckets
+        self._series: dict[tuple, list] = {}  # labels -> [bucket counts, sum, count]
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float, labels: tuple[tuple[str, str], ...]):
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * len(self.buckets), 0.0, 0]
+            position = bisect_left(self.buckets, seconds)
+            if position < len(self.buckets):
+                series[0][position] += 1
+            series[1] += seconds
+            series[2] += 1
+
+    def snapshot(self) -> dict[tuple, tuple[list[int], float, int]]:
+        with self._lock:
+            return {labels: (list(counts), total, count) for labels, (counts, total, count) in self._series.items()}
+
+    def clear(self):
+        with self._lock:
+            self._series.clear()
+
+
+class _Span:
+    __slots__ = ("labels", "start")
+
+    def __init__(self, labels: tuple[tuple[str, str], ...]):
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        labels = self.labels + (("outcome", "error" if exc_type else "ok"),)
+        stage_seconds.observe(time.perf_counter() - self.start, labels)
+        return False
+
+
+stage_seconds = Histogram()
+enabled = os.getenv("CV_METRICS", "0") == "1"
+
+
+def span(stage: str, **labels: str):
+    """Time the enclosed block as `stage` (plus extra labels such as model); a no-op when disabled."""
+    if not enabled:
+        return _NOOP
+    return _Span((("stage", stage),) + tuple(sorted((k, str(v)) for k, v in labels.items())))
+
+
+def timed(stage: str, **labels: str):
+    """Decorator form of span() for whole functions."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(stage, **labels):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _format_labels(labels: tuple[tuple[str, str], ...]) -> str:
+    def escape(value: str) -> str:
+        return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return "{" + ",".join(f'{k}="{escape(v)}"' for k, v in labels) + "}"
+
+
+def render_prometheus() -> str:
+    """All recorded spans in the Prometheus text exposition format."""
+    lines = [
+        f"# HELP {METRIC_NAME} Time spent in each CV pipeline stage.",
+        f"# TYPE {METRIC_NAME} histogram",
+    ]
+    for labels, (counts, total, count) in sorted(stage_seconds.snapshot().items()):
+        cumulative = 0
+        for bound, n in zip(stage_seconds.buckets, counts):
+            cumulative += n
+            lines.append(f"{METRIC_NAME}_bucket{_format_labels(labels + (('le', f'{bound:g}'),))} {cumulative}")
+        lines.append(f"{METRIC_NAME}_bucket{_format_labels(labels + (('le', '+Inf'),))} {count}")
+        lines.append(f"{METRIC_NAME}_sum{_format_labels(labels)} {total:.6f}")
+        lines.append(f"{METRIC_NAME}_count{_format_labels(labels)} {count}")
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(path: str):
+    """Write the current histograms to `path` (atomically, so a scraper never reads half a file)."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(render_prometheus())
+    os.replace(tmp_path, path)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = render_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+_server: Optional[ThreadingHTTPServer] = None
+_server_lock = threading.Lock()
+
+
+def serve(port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """Serve /metrics on a background thread (once per process; Streamlit reruns reuse it)."""
+    global _server
+    with _server_lock:
+        if _server is None:
+            _server = ThreadingHTTPServer((host, port), _MetricsHandler)
+            threading.Thread(target=_server.serve_forever, name="metrics", daemon=True).start()
+            logger.info(f"Serving metrics on http://{host}:{port}/metrics")
+        return _server
+
+
+def enable(port: Optional[int] = None, path: Optional[str] = None):
+    """Start recording spans, optionally exporting them on a port and/or to a file at exit."""
+    global enabled
+    enabled = True
+    if port:
+        serve(port)
+    if path:
+        atexit.register(write_prometheus, path)
+
+
+if enabled:
+    enable(port=int(os.getenv("CV_METRICS_PORT", "0")) or None, path=os.getenv("CV_METRICS_FILE"))
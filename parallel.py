@@ -0,0 +1,113 @@
+import contextlib
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+
+class ItemTimeoutError(TimeoutError):
+    """Raised (as a result) for an item whose worker ran longer than its timeout."""
+
+
+class _ItemClock:
+    """Time an item has been running, not counting time spent in timeout_paused()."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._start = time.monotonic()
+        self._paused_since: Optional[float] = None
+        self._depth = 0
+
+    def elapsed(self, now: float) -> float:
+        with self._lock:
+            return (self._paused_since if self._paused_since is not None else now) - self._start
+
+    def pause(self):
+        with self._lock:
+            self._depth += 1
+            if self._depth == 1:
+                self._paused_since = time.monotonic()
+
+    def resume(self):
+        with self._lock:
+            self._depth -= 1
+            if self._depth == 0:
+                self._start += time.monotonic() - self._paused_since
+                self._paused_since = None
+
+
+_local = threading.local()
+
+
+@contextlib.contextmanager
+def timeout_paused():
+    """
+        Stop the run_bounded timeout clock of the calling worker's item for the enclosed block.
+
+        Meant for waits that are not the item's own work, such as queueing for a
+        rate limit slot; outside a run_bounded worker it does nothing.
+    """
+    clock = getattr(_local, "clock", None)
+    if clock is None:
+        yield
+        return
+    clock.pause()
+    try:
+        yield
+    finally:
+        clock.resume()
+
+
+def run_bounded(fn: Callable[[Any], Any], items: Iterable[Any], max_workers: int = 4,
+                timeout: Optional[float] = None) -> Iterator[tuple[Any, Any, Optional[BaseException]]]:
+    """
+        Run fn over items with at most max_workers calls in flight.
+
+        Yields (item, result, error) in completion order. A failing item never
+        affects the others; an item running longer than `timeout` seconds (measured
+        from when its worker started, not from submission, and not counting time
+        in timeout_paused()) is reported with an ItemTimeoutError and abandoned.
+
+        Python threads cannot be killed: an abandoned worker keeps running until
+        fn returns, holding whatever it uses (a connection, a rate limit slot it
+        already got, an LLM request that still counts against the quota). Its
+        result is discarded. Keep fn's own I/O timeouts no longer than `timeout`.
+    """
+    clocks: dict[int, _ItemClock] = {}
+    lock = threading.Lock()
+
+    def _worker(index: int, item: Any) -> Any:
+        clock = _ItemClock()
+        with lock:
+            clocks[index] = clock
+        _local.clock = clock
+        try:
+            return fn(item)
+        finally:
+            _local.clock = None
+
+    executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+    try:
+        pending = {executor.submit(_worker, index, item): (index, item) for index, item in enumerate(items)}
+
+        while pending:
+            done, _ = wait(pending, timeout=0.1 if timeout else None, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                _, item = pending.pop(future)
+                try:
+                    yield item, future.result(), None
+                except Exception as e:
+                    yield item, None, e
+
+            if timeout:
+                now = time.monotonic()
+                with lock:
+                    expired = [f for f, (index, _) in pending.items()
+                               if index in clocks and clocks[index].elapsed(now) > timeout]
+                for future in expired:
+                    _, item = pending.pop(future)
+                    yield item, None, ItemTimeoutError(f"Timed out after {timeout:g}s")
+    finally:
+        # Abandoned (timed out) workers are left to finish on their own
+        executor.shutdown(wait=False, cancel_futures=True)
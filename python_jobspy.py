@@ -4,7 +4,7 @@
 """
 
 import csv
-from jobspy import scrape_jobs
+from job_search import search_jobs, describe_cache_status
 import streamlit as st
 import pandas as pd
 
@@ -21,10 +21,9 @@ hours_old = st.number_input("How many hours old?", min_value=1, max_value=168, v
 country_indeed = st.text_input("Country (for Indeed)", "USA")
 
 if st.button("scrape jobs"):
-    jobs = scrape_jobs(
+    jobs, cache_status = search_jobs(
         site_name=site_name,
         search_term=search_term,
-        google_search_term= f"{search_term} jobs near {location}",
         location=location,
         results_wanted= results_wanted,
         hours_old=hours_old,
@@ -36,6 +35,7 @@ if st.button("scrape jobs"):
 
     if len(jobs) > 0:
         st.success(f"Found {len(jobs)} jobs")
+        st.caption(describe_cache_status(cache_status))
         
         # Display job data in a table
         st.dataframe(jobs)
@@ -0,0 +1,257 @@
+"""
+        Central pacing for Groq calls: per-model token buckets, retries and priorities
+
+        rate_limiter.call("llama3-8b-8192", lambda: client.chat.completions.create(...), tokens=1200)
+
+        with rate_limiter.priority(rate_limiter.BULK):
+            ...  # shortlisting: waits behind interactive single-resume requests
+
+        Every model has two buckets refilled continuously at its configured limits,
+        one for requests per minute and one for tokens per minute. Admitted
+        requests are spaced evenly, so sustained throughput sits at the limit
+        instead of bursting into 429s and then stalling. Waiting
+        requests are served in priority order (then first come, first served).
+        A 429 pauses the whole model for its retry-after (or an exponential
+        backoff) and the request is queued again; 5xx and connection errors are
+        retried the same way.
+
+        Limits depend on the Groq account tier, so none are assumed: by default
+        calls are not paced and only 429s (with their retry-after) slow them
+        down. Set GROQ_RATE_LIMITS to the account's limits to pace ahead of them,
+        e.g. for the free tier:
+
+        GROQ_RATE_LIMITS="llama-3.3-70b-versatile=30:6000,llama3-8b-8192=30:30000,*=30:6000"
+                                rpm:tpm per model ("*" = any other, 0 = unlimited)
+        GROQ_MAX_RETRIES=5      retries per request before giving up
+
+        The limits in effect are logged when the scheduler is created.
+"""
+
+import contextlib
+import contextvars
+import heapq
+import itertools
+import logging
+import os
+import random
+import threading
+import time
+from typing import Callable, Iterator, Optional, TypeVar
+
+import groq
+import metrics
+from parallel import timeout_paused
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Lower runs first
+INTERACTIVE = 0
+BULK = 10
+
+# (requests, tokens per minute), 0 = unlimited; no pacing unless GROQ_RATE_LIMITS sets the account's limits
+DEFAULT_LIMITS = {
+    "*": (0, 0),
+}
+MAX_RETRIES = int(os.getenv("GROQ_MAX_RETRIES", "5"))
+BASE_BACKOFF = 1.0
+MAX_BACKOFF = 60.0
+
+_priority: contextvars.ContextVar[int] = contextvars.ContextVar("groq_priority", default=INTERACTIVE)
+
+
+def parse_limits(spec: Optional[str]) -> dict[str, tuple[int, int]]:
+    """DEFAULT_LIMITS updated from a "model=rpm:tpm,..." string."""
+    limits = dict(DEFAULT_LIMITS)
+    for item in (spec or "").split(","):
+        if not item.strip():
+            continue
+        model, _, values = item.strip().rpartition("=")
+        rpm, tpm = values.split(":")
+        limits[model or "*"] = (int(rpm), int(tpm))
+    return limits
+
+
+@contextlib.contextmanager
+def priority(level: int):
+    """Run the enclosed Groq calls (in this thread or task) at `level`, e.g. BULK."""
+    token = _priority.set(level)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+class TokenBucket:
+    """
+        Refilled at `rate` units per second, holding at most `burst` units (not thread-safe on its own).
+        A rate of 0 means unlimited.
+
+        A request is admitted as soon as the level is not negative and then pays
+        its full amount, going into debt if needed. With no burst this spaces
+        requests at exactly the rate, and a single request larger than a second's
+        worth (a packed batch can be most of a minute's tokens) still gets through.
+    """
+
+    def __init__(self, rate: float, burst: float = 0.0):
+        self.rate = rate
+        self.burst = burst
+        self.level = burst
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float):
+        self.level = min(self.burst, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, now: float) -> float:
+        """Seconds until the next request may be admitted (0 when it may go now)."""
+        if self.rate <= 0:
+            return 0.0
+        self._refill(now)
+        return 0.0 if self.level >= 0 else -self.level / self.rate
+
+    def take(self, amount: float, now: float):
+        if self.rate <= 0:
+            return
+        self._refill(now)
+        self.level -= amount
+
+
+class _ModelState:
+    def __init__(self, rpm: int, tpm: int):
+        self.requests = TokenBucket(rpm / 60)
+        self.tokens = TokenBucket(tpm / 60)
+        self.paused_until = 0.0
+        self.waiting: list[tuple[int, int]] = []  # heap of (priority, arrival)
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """429s, server errors and dropped connections are worth another try; anything else is not."""
+    status = getattr(exc, "status_code", None)
+    if status is not None:
+        return status == 429 or status >= 500
+    return isinstance(exc, groq.APIConnectionError)
+
+
+def retry_after(exc: BaseException) -> Optional[float]:
+    """Seconds from the retry-after(-ms) header of a failed response, if it sent one."""
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        if "retry-after-ms" in headers:
+            return float(headers["retry-after-ms"]) / 1000
+        if "retry-after" in headers:
+            return float(headers["retry-after"])
+    except ValueError:
+        pass  # HTTP-date form; fall back to backoff
+    return None
+
+
+class RateLimitScheduler:
+    """Admits Groq calls per model within the rpm/tpm limits, highest priority first."""
+
+    def __init__(self, limits: Optional[dict[str, tuple[int, int]]] = None, max_retries: int = MAX_RETRIES):
+        self.limits = limits or parse_limits(os.getenv("GROQ_RATE_LIMITS"))
+        self.max_retries = max_retries
+        self._models: dict[str, _ModelState] = {}
+        self._arrivals = itertools.count()
+        self._cond = threading.Condition()
+        logger.info("Groq rate limits (rpm:tpm, 0 = unlimited): " + ", ".join(
+            f"{model}={rpm}:{tpm}" for model, (rpm, tpm) in self.limits.items()
+        ))
+
+    def _state(self, model: str) -> _ModelState:
+        state = self._models.get(model)
+        if state is None:
+            state = self._models[model] = _ModelState(*self.limits.get(model, self.limits["*"]))
+        return state
+
+    def acquire(self, model: str, tokens: int = 0, level: Optional[int] = None):
+        """Block until this request is first in line for `model` and both buckets can pay for it."""
+        ticket = (_priority.get() if level is None else level, next(self._arrivals))
+        # Queueing here is not the caller's work, so it does not count against a run_bounded timeout
+        with metrics.span("rate_limit_wait", model=model), timeout_paused(), self._cond:
+            state = self._state(model)
+            heapq.heappush(state.waiting, ticket)
+            try:
+                while True:
+                    timeout = None
+                    if state.waiting[0] == ticket:
+                        now = time.monotonic()
+                        timeout = max(
+                            state.paused_until - now,
+                            state.requests.wait_time(now),
+                            state.tokens.wait_time(now),
+                        )
+                        if timeout <= 0:
+                            state.requests.take(1, now)
+                            state.tokens.take(tokens, now)
+                            heapq.heappop(state.waiting)
+                            self._cond.notify_all()
+                            return
+                    self._cond.wait(timeout)
+            except BaseException:
+                state.waiting.remove(ticket)
+                heapq.heapify(state.waiting)
+                self._cond.notify_all()
+                raise
+
+    def backoff(self, model: str, exc: BaseException, attempt: int) -> float:
+        """Pause `model` after a failed call and return the delay that was applied."""
+        delay = retry_after(exc)
+        if delay is None:
+            delay = min(MAX_BACKOFF, BASE_BACKOFF * 2 ** attempt) * random.uniform(0.5, 1.0)
+        with self._cond:
+            state = self._state(model)
+            state.paused_until = max(state.paused_until, time.monotonic() + delay)
+            self._cond.notify_all()
+        logger.warning(f"{model}: {exc.__class__.__name__} (attempt {attempt + 1}), retrying in {delay:.1f}s")
+        return delay
+
+    def call(self, model: str, fn: Callable[[], T], tokens: int = 0) -> T:
+        """Run fn() once admitted, retrying rate limit and transient errors."""
+        for attempt in itertools.count():
+            self.acquire(model, tokens)
+            try:
+                return fn()
+            except Exception as exc:
+                if attempt >= self.max_retries or not is_retryable(exc):
+                    raise
+                self.backoff(model, exc, attempt)
+
+    def stream(self, model: str, start: Callable[[], Iterator[T]], tokens: int = 0) -> Iterator[T]:
+        """Like call() for a streamed response; only retried until the first chunk has been yielded."""
+        for attempt in itertools.count():
+            self.acquire(model, tokens)
+            started = False
+            try:
+                for chunk in start():
+                    started = True
+                    yield chunk
+                return
+            except Exception as exc:
+                if started or attempt >= self.max_retries or not is_retryable(exc):
+                    raise
+                self.backoff(model, exc, attempt)
+
+
+_scheduler: Optional[RateLimitScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> RateLimitScheduler:
+    """Process-wide scheduler, shared by every page, rerun and worker thread."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = RateLimitScheduler()
+        return _scheduler
+
+
+def call(model: str, fn: Callable[[], T], tokens: int = 0) -> T:
+    return get_scheduler().call(model, fn, tokens)
+
+
+def stream(model: str, start: Callable[[], Iterator[T]], tokens: int = 0) -> Iterator[T]:
+    return get_scheduler().stream(model, start, tokens)
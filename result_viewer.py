@@ -0,0 +1,81 @@
+import math
+from typing import Optional
+import pandas as pd
+import streamlit as st
+
+PAGE_SIZES = [25, 50, 100, 250]
+
+
+def filter_rows(df: pd.DataFrame, query: str) -> pd.DataFrame:
+    """Rows where any text column contains every word of the query (case-insensitive)."""
+    words = query.lower().split()
+    if not words or df.empty:
+        return df
+    text_columns = [c for c in df.columns if df[c].dtype == object or pd.api.types.is_string_dtype(df[c].dtype)]
+    haystack = df[text_columns].fillna("").astype(str).agg(" ".join, axis=1).str.lower()
+    mask = pd.Series(True, index=df.index)
+    for word in words:
+        mask &= haystack.str.contains(word, regex=False)
+    return df[mask]
+
+
+def sort_rows(df: pd.DataFrame, column: Optional[str], ascending: bool) -> pd.DataFrame:
+    if not column or column not in df.columns:
+        return df
+    return df.sort_values(column, ascending=ascending, na_position="last", kind="stable")
+
+
+def page_slice(df: pd.DataFrame, page: int, page_size: int) -> pd.DataFrame:
+    start = (page - 1) * page_size
+    return df.iloc[start:start + page_size]
+
+
+def render_result_table(df: pd.DataFrame, key: str, link_columns: tuple[str, ...] = (),
+                        default_sort: Optional[str] = None, default_ascending: bool = False,
+                        column_config: Optional[dict] = None):
+    """
+        Filterable, sortable, paginated table for large result sets.
+
+        Filtering, sorting and slicing happen here on the server; only the
+        visible page is sent to the browser. URL columns are rendered as native
+        link columns instead of HTML strings. Rows keep their given order
+        until a sort column is chosen (or `default_sort` names one). Widget
+        state lives under `key`, so several viewers can share a page.
+    """
+    if df.empty:
+        st.info("No results to show")
+        return
+
+    columns = list(df.columns)
+    col1, col2, col3, col4 = st.columns([3, 2, 1, 1])
+    with col1:
+        query = st.text_input("Filter", key=f"{key}_filter", placeholder="Type to filter rows")
+    with col2:
+        sort_column = st.selectbox(
+            "Sort by", [None] + columns, key=f"{key}_sort",
+            index=columns.index(default_sort) + 1 if default_sort in columns else 0,
+            format_func=lambda column: "(none)" if column is None else column,
+        )
+    with col3:
+        ascending = st.toggle("Ascending", value=default_ascending, key=f"{key}_ascending")
+    with col4:
+        page_size = st.selectbox("Rows per page", PAGE_SIZES, index=1, key=f"{key}_page_size")
+
+    view = sort_rows(filter_rows(df, query), sort_column, ascending)
+    pages = max(1, math.ceil(len(view) / page_size))
+
+    # A new filter or page size can leave the remembered page past the end
+    if st.session_state.get(f"{key}_page", 1) > pages:
+        st.session_state[f"{key}_page"] = 1
+    page = st.number_input("Page", min_value=1, max_value=pages, step=1, key=f"{key}_page")
+
+    config = {column: st.column_config.LinkColumn(column) for column in link_columns}
+    config.update(column_config or {})
+    visible = page_slice(view, page, page_size)
+    st.dataframe(visible, column_config=config, hide_index=True, use_container_width=True)
+
+    if len(view):
+        st.caption(f"Rows {(page - 1) * page_size + 1}–{(page - 1) * page_size + len(visible)} of {len(view)}"
+                   + (f" (filtered from {len(df)})" if len(view) != len(df) else ""))
+    else:
+        st.caption(f"No rows match the filter (of {len(df)})")
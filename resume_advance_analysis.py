@@ -1,7 +1,9 @@
-import streamlit as st
-from typing import Any,Dict
+from typing import Any,Callable,Dict,Optional
 import json
-from groq import Groq
+from llm_clients import get_groq_client, get_groq_api_key
+import metrics
+import rate_limiter
+from compaction import count_tokens
 import re
 import os
 import logging
@@ -10,16 +12,6 @@ import logging
 # logger = logging.getLogger(__name__)
 
 
-# os.environ['GROQ_API_KEY'] = os.getenv("GROQ_API_KEY")
-groq_api_key = os.getenv("GROQ_API_KEY")
-if groq_api_key is None:
-    try:
-        groq_api_key = st.secrets["GROQ_API_KEY"]
-    except Exception as e:
-        st.error("GROQ_API_KEY is not set in the environment variables or Streamlit secrets.")
-        groq_api_key = None
-# groq_api_key = st.secrets["GROQ_API_KEY"]
-
 class ResumeImprovementEngine: 
     def __init__(self):
         # self.llm = ChatGroq(
@@ -28,15 +20,19 @@ class ResumeImprovementEngine:
         #     temperature=0.7,
         #     max_tokens=4096
         # )
-        self.client = Groq(api_key=groq_api_key)
+        # The key is looked up when the engine is built, not at import time
+        self.client = get_groq_client(get_groq_api_key())
         # logger.info("ResumeImprovementEngine initialized with Groq API key.")
 
-    def generate_resume_improvement_suggestions(self, resume_text: str) -> dict[str, Any]:
+    def generate_resume_improvement_suggestions(self, resume_text: str,
+                                                on_token: Optional[Callable[[str], None]] = None) -> dict[str, Any]:
             """
             Generate comprehensive resume improvement suggestions
             
             Args:
                 resume_text (str): Full text of the resume
+                on_token (callable, optional): When given, the completion is streamed
+                    and each text delta is passed to it as it arrives
             
             Returns:
                 Dict containing detailed improvement suggestions
@@ -86,41 +82,53 @@ class ResumeImprovementEngine:
             }}
             """
             
-            try:
-                # logger.info("Sending request to Groq for resume improvement.")
-                # Make API call to generate improvement suggestions
-                chat_completion = self.client.chat.completions.create(
-                    messages=[
-                        {
-                            "role": "system", 
-                            "content": "You are an expert resume consultant providing detailed, constructive feedback."
-                        },
-                        {
-                            "role": "user", 
-                            "content": prompt
-                        }
-                    ],
-                    model="llama-3.3-70b-versatile",
-                    temperature=0.7,
-                    max_tokens=2048,
-                    top_p=1,
-                    stream=False
+            # logger.info("Sending request to Groq for resume improvement.")
+            # Make API call to generate improvement suggestions
+            with metrics.span("llm", model="llama-3.3-70b-versatile"):
+                # A 429 arrives before the first chunk, so retrying the create call covers streaming too
+                chat_completion = rate_limiter.call(
+                    "llama-3.3-70b-versatile",
+                    lambda: self.client.chat.completions.create(
+                        messages=[
+                            {
+                                "role": "system", 
+                                "content": "You are an expert resume consultant providing detailed, constructive feedback."
+                            },
+                            {
+                                "role": "user", 
+                                "content": prompt
+                            }
+                        ],
+                        model="llama-3.3-70b-versatile",
+                        temperature=0.7,
+                        max_tokens=2048,
+                        top_p=1,
+                        stream=on_token is not None
+                    ),
+                    tokens=count_tokens(prompt) + 1200,  # typical length of the JSON answer
                 )
 
                 # logger.info("Groq API response received.")
-                
-                # Extract and parse the JSON response
-                response_text = chat_completion.choices[0].message.content
+
+                if on_token is not None:
+                    # Hand each delta to the caller while collecting the full text
+                    parts = []
+                    for chunk in chat_completion:
+                        delta = chunk.choices[0].delta.content if chunk.choices else None
+                        if delta:
+                            parts.append(delta)
+                            on_token(delta)
+                    response_text = "".join(parts)
+                else:
+                    response_text = chat_completion.choices[0].message.content
+            
+            # Extract and parse the JSON response
+            with metrics.span("json_parse"):
                 suggestions = self._extract_json(response_text)
 
-                # logger.debug(f"Improvement suggestions received: {suggestions}")
-                
-                return suggestions
+            # logger.debug(f"Improvement suggestions received: {suggestions}")
             
-            except Exception as e:
-                st.error(f"Resume Improvement Error: {e}")
-                # logger.error(f"Resume Improvement Error: {e}")
-                return {}
+            return suggestions
             
     
     def _extract_json(self, text: str) -> dict[str, Any]:
@@ -133,19 +141,13 @@ class ResumeImprovementEngine:
         Returns:
             Dict of extracted JSON or empty dict
         """
-        try:
-            # logger.debug("Extracting JSON from response text.")
+        # logger.debug("Extracting JSON from response text.")
 
-            json_match = re.search(r'\{.*\}', text, re.DOTALL | re.MULTILINE)
-            if json_match:
-                return json.loads(json_match.group(0))
-            
-            # logger.warning("No valid JSON found in response text.")
-
-            return {}
+        json_match = re.search(r'\{.*\}', text, re.DOTALL | re.MULTILINE)
+        if json_match:
+            return json.loads(json_match.group(0))
         
-        except Exception as e:
-            st.error(f"JSON Extraction Error: {e}")
-            # logger.error(f"JSON Extraction Error: {e}")
-            return {}
+        # logger.warning("No valid JSON found in response text.")
+
+        return {}
         
\ No newline at end of file
@@ -0,0 +1,98 @@
+from typing import Optional
+import numpy as np
+
+# Same weights as CVAnalyzer.calculate_match_score
+SCORE_WEIGHTS = {"skills_match": 0.5, "experience_match": 0.3}
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """Positions of the k highest scores, best first, without sorting the whole array."""
+    if k >= len(scores):
+        return np.argsort(-scores, kind="stable")
+    top = np.argpartition(-scores, k)[:k]
+    return top[np.argsort(-scores[top], kind="stable")]
+
+
+def build_skill_vocabulary(skills: list[str]) -> dict[str, int]:
+    """Map each distinct lowercase skill to a column index."""
+    vocabulary: dict[str, int] = {}
+    for skill in skills:
+        vocabulary.setdefault(skill.lower(), len(vocabulary))
+    return vocabulary
+
+
+def fuzzy_skill_aliases(candidates: list[dict], vocabulary: dict[str, int]) -> dict[str, int]:
+    """Map candidate skills that miss the vocabulary exactly to their nearest vocabulary column."""
+    # scikit-learn and FAISS take a while to import, so only load them when fuzzy matching is used
+    from skill_index import SkillIndex
+
+    unmatched = list({
+        skill.lower()
+        for cv_info in candidates
+        for skill in cv_info.get("skills") or []
+        if skill.lower() not in vocabulary
+    })
+    index = SkillIndex(list(vocabulary))
+    return {
+        skill: vocabulary[match]
+        for skill, match in zip(unmatched, index.lookup(unmatched))
+        if match is not None
+    }
+
+
+def encode_skills(candidates: list[dict], vocabulary: dict[str, int],
+                  aliases: Optional[dict[str, int]] = None) -> np.ndarray:
+    """Boolean incidence matrix (candidates x vocabulary) of the skills each candidate lists."""
+    lookup = {**(aliases or {}), **vocabulary}
+    rows, cols = [], []
+    for row, cv_info in enumerate(candidates):
+        for skill in cv_info.get("skills") or []:
+            col = lookup.get(skill.lower())
+            if col is not None:
+                rows.append(row)
+                cols.append(col)
+
+    matrix = np.zeros((len(candidates), len(vocabulary)), dtype=bool)
+    matrix[rows, cols] = True  # duplicates collapse, like the set intersection in the scalar scorer
+    return matrix
+
+
+def score_candidates(candidates: list[dict], jd_requirements: dict, fuzzy: bool = False) -> dict[str, np.ndarray]:
+    """
+        Score many candidates against the job requirements in one vectorized pass.
+
+        Gives the same numbers as CVAnalyzer.calculate_match_score for every
+        candidate it can score. Inputs where the scalar version raises (missing
+        skills or experience, no required skills) score 0 for that component.
+    """
+    n = len(candidates)
+    skills_match = np.zeros(n)
+    experience_match = np.zeros(n)
+
+    required = jd_requirements.get("required_skills")
+    if required:
+        vocabulary = build_skill_vocabulary(required)
+        aliases = fuzzy_skill_aliases(candidates, vocabulary) if fuzzy else None
+        incidence = encode_skills(candidates, vocabulary, aliases)
+        skills_match = incidence.sum(axis=1) / len(vocabulary)
+
+    if "min_years_experience" in jd_requirements:
+        min_years = jd_requirements["min_years_experience"]
+        years = np.array(
+            [np.nan if c.get("years_of_exp") is None else c["years_of_exp"] for c in candidates],
+            dtype=float,
+        )
+        known = ~np.isnan(years)
+        meets = known & (years >= min_years)
+        partial = known & ~meets
+        experience_match[meets] = 1.0
+        if min_years:
+            experience_match[partial] = years[partial] / min_years
+
+    overall_score = skills_match * SCORE_WEIGHTS["skills_match"] + experience_match * SCORE_WEIGHTS["experience_match"]
+
+    return {
+        "skills_match": skills_match,
+        "experience_match": experience_match,
+        "overall_score": overall_score,
+    }
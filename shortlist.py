@@ -0,0 +1,65 @@
+from typing import Optional
+import numpy as np
+import pandas as pd
+from scoring import top_k_indices
+
+SCORE_COLUMNS = ("skills_match", "experience_match", "overall_score")
+
+# Column titles used when the shortlist is shown in the UI
+DISPLAY_NAMES = {
+    "name": "Name",
+    "years_of_exp": "Experience (Years)",
+    "skills": "Skills",
+    "certifications": "Certifications",
+    "skills_match": "Skills Match",
+    "experience_match": "Experience Match",
+    "overall_score": "Overall Score",
+}
+
+
+class ShortlistResults:
+    """
+        Columnar shortlist with typed columns and float scores in [0, 1].
+
+        Scores stay numeric so ordering is numeric; percentages are only
+        produced by display_frame(). top_k() selects the best candidates with a
+        partial sort instead of ordering the whole pool.
+    """
+
+    def __init__(self, frame: pd.DataFrame):
+        self.frame = frame
+
+    @classmethod
+    def from_candidates(cls, candidates: list[dict], scores: dict[str, np.ndarray],
+                        files: Optional[list[str]] = None) -> "ShortlistResults":
+        """Build from candidate dicts and the score arrays aligned with them (see scoring.score_candidates)."""
+        columns = {}
+        if files is not None:
+            columns["file"] = pd.array(files, dtype="string")
+        columns.update({
+            "name": pd.array([c.get("name") or "Unknown" for c in candidates], dtype="string"),
+            "years_of_exp": pd.array([c.get("years_of_exp") for c in candidates], dtype="Int64"),
+            "skills": pd.array([", ".join(c.get("skills") or []) for c in candidates], dtype="string"),
+            "certifications": pd.array([", ".join(c.get("certifications") or []) for c in candidates], dtype="string"),
+        })
+        for column in SCORE_COLUMNS:
+            columns[column] = np.asarray(scores[column], dtype=np.float64)
+        return cls(pd.DataFrame(columns))
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def top_k(self, k: int, by: str = "overall_score") -> "ShortlistResults":
+        """The k best candidates by a score column, best first."""
+        order = top_k_indices(self.frame[by].to_numpy(), k)
+        return ShortlistResults(self.frame.iloc[order].reset_index(drop=True))
+
+    def to_frame(self) -> pd.DataFrame:
+        return self.frame.copy()
+
+    def display_frame(self) -> pd.DataFrame:
+        """Frame for st.dataframe: UI column titles, scores as numeric percentages (0-100)."""
+        frame = self.frame.copy()
+        for column in SCORE_COLUMNS:
+            frame[column] = frame[column] * 100
+        return frame.rename(columns=DISPLAY_NAMES)
@@ -0,0 +1,183 @@
+"""
+        Headless batch shortlisting
+
+        Scores a folder (or glob) of CVs against a requirements file without the
+        Streamlit UI. CSV results are written after every chunk of files (Parquet
+        once at the end), and finished files are recorded in a checkpoint so an
+        interrupted run picks up where it stopped. A resumed run rebuilds the
+        output from the checkpoint for the files still matching the source,
+        and re-processes files whose content changed.
+
+        python shortlist_cli.py cvs/ --requirements requirements.json --output results.csv
+        python shortlist_cli.py "cvs/**/*.pdf" -r requirements.json -o results.parquet --workers 8
+
+        requirements.json: {"min_years_experience": 3, "required_skills": ["Python", "SQL"]}
+"""
+
+import argparse
+import glob
+import json
+import logging
+import os
+import sys
+import pandas as pd
+import extraction as extr
+import metrics
+from cv_cache import content_hash
+from cv_short import CVAnalyzer, DEFAULT_MAX_WORKERS, DEFAULT_TIMEOUT
+from shortlist import ShortlistResults
+
+logger = logging.getLogger("shortlist_cli")
+
+CV_EXTENSIONS = (".pdf", ".txt")
+
+
+def find_cv_files(source: str) -> list[str]:
+    """All CV files under a directory, or matching a glob pattern, in a stable order."""
+    if os.path.isdir(source):
+        paths = glob.glob(os.path.join(source, "**", "*"), recursive=True)
+    else:
+        paths = glob.glob(source, recursive=True)
+    return sorted(p for p in paths if os.path.isfile(p) and p.lower().endswith(CV_EXTENSIONS))
+
+
+def file_hash(path: str) -> str:
+    with open(path, "rb") as f:
+        return content_hash(f.read())
+
+
+def load_checkpoint(path: str) -> dict[str, dict]:
+    """Completed files from a previous run, keyed by path (a later record for a path replaces an earlier one)."""
+    done = {}
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    done[record["path"]] = record
+    return done
+
+
+def score_records(records: list[dict], requirements: dict, analyzer: CVAnalyzer, fuzzy: bool) -> pd.DataFrame:
+    """One row per extracted candidate, with float scores."""
+    rows = [
+        {"file": record["path"], **candidate}
+        for record in records
+        for candidate in record["candidates"]
+    ]
+    if not rows:
+        return pd.DataFrame()
+
+    scores = analyzer.calculate_match_scores(rows, requirements, fuzzy=fuzzy)
+    return ShortlistResults.from_candidates(rows, scores, files=[r["file"] for r in rows]).to_frame()
+
+
+def write_results(frame: pd.DataFrame, output: str, append: bool):
+    if output.endswith(".parquet"):
+        frame.to_parquet(output, index=False)
+    else:
+        frame.to_csv(output, mode="a" if append else "w", header=not append, index=False)
+
+
+def run(args) -> int:
+    with open(args.requirements, encoding="utf-8") as f:
+        requirements = json.load(f)
+
+    files = find_cv_files(args.source)
+    hashes = {p: file_hash(p) for p in files}
+    checkpoint_path = args.checkpoint or f"{args.output}.checkpoint.jsonl"
+    done = load_checkpoint(checkpoint_path)
+    # Files deleted (or no longer matched) since they were checkpointed are left out of the output
+    removed = [p for p in done if p not in hashes]
+    for path in removed:
+        del done[path]
+    # A file edited since it was checkpointed is processed again
+    changed = [p for p in files if p in done and done[p].get("sha256") != hashes[p]]
+    for path in changed:
+        del done[path]
+    todo = [p for p in files if p not in done]
+    logger.info(f"{len(files)} CV file(s) found, {len(files) - len(todo)} already done, "
+                f"{len(todo)} to process ({len(changed)} changed, {len(removed)} removed)")
+
+    # The LLM (and its API key) is only needed once a file has to be extracted
+    analyzer = CVAnalyzer(max_workers=args.workers, timeout=args.timeout)
+    parquet = args.output.endswith(".parquet")
+    if not parquet:
+        # Rebuild the CSV from the checkpoint: it may be missing, hold rows of changed files,
+        # or rows a crash wrote before their checkpoint line
+        frame = score_records(list(done.values()), requirements, analyzer, args.fuzzy)
+        if os.path.exists(args.output):
+            os.remove(args.output)
+        if not frame.empty:
+            write_results(frame, args.output, append=False)
+    append = not parquet and os.path.exists(args.output)
+    failures = 0
+
+    for start in range(0, len(todo), args.chunk_size):
+        chunk = todo[start:start + args.chunk_size]
+        uploads = [extr.load_local_file(p) for p in chunk]
+        records = []
+
+        for path, upload, result in zip(chunk, uploads, analyzer.extract_batch(uploads, pack=args.pack)):
+            if result.error:
+                # Not checkpointed, so the next run retries it
+                failures += 1
+                logger.error(f"{path}: {result.error}")
+                continue
+            records.append({
+                "path": path,
+                "sha256": content_hash(upload.getvalue()),
+                "candidates": [c.model_dump() for c in result.candidates],
+            })
+
+        # Rows first, checkpoint second: a crash in between only costs re-processing the chunk
+        if not parquet:
+            frame = score_records(records, requirements, analyzer, args.fuzzy)
+            if not frame.empty:
+                write_results(frame, args.output, append=append)
+                append = True
+
+        with open(checkpoint_path, "a", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+                done[record["path"]] = record
+            f.flush()
+            os.fsync(f.fileno())
+
+        logger.info(f"Processed {min(start + args.chunk_size, len(todo))}/{len(todo)} file(s)")
+
+    if parquet:
+        # Written once from the checkpoint; rewriting it per chunk would be quadratic
+        write_results(score_records(list(done.values()), requirements, analyzer, args.fuzzy), args.output, append=False)
+
+    logger.info(f"Done: {len(done)} file(s) shortlisted, {failures} failed -> {args.output}")
+    return 1 if failures else 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Shortlist a folder of CVs against job requirements.")
+    parser.add_argument("source", help="Directory of CVs or a glob pattern (pdf/txt)")
+    parser.add_argument("-r", "--requirements", required=True, help="JSON file with min_years_experience and required_skills")
+    parser.add_argument("-o", "--output", required=True, help="Results file (.csv or .parquet)")
+    parser.add_argument("--checkpoint", help="Checkpoint file (default: <output>.checkpoint.jsonl)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_MAX_WORKERS, help="Concurrent extractions")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="Seconds allowed per CV")
+    parser.add_argument("--chunk-size", type=int, default=50, help="Files processed between result/checkpoint writes")
+    parser.add_argument("--pack", action="store_true", help="Pack short CVs into shared LLM requests")
+    parser.add_argument("--fuzzy", action="store_true", help="Match similar skill names")
+    parser.add_argument("--log-level", default="INFO")
+    parser.add_argument("--metrics", help="Write per-stage latency histograms (Prometheus text format) to this file")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=args.log_level.upper(), format='%(asctime)s - %(levelname)s - %(message)s')
+    if args.metrics:
+        metrics.enable()
+    try:
+        return run(args)
+    finally:
+        if args.metrics:
+            metrics.write_prometheus(args.metrics)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+import re
+from typing import Optional, Protocol
+import numpy as np
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfVectorizer
+
+try:
+    import faiss
+except ImportError:  # faiss-cpu is optional; fall back to a NumPy inner product search
+    faiss = None
+
+# Minimum cosine similarity for two skill names to be treated as the same skill
+DEFAULT_THRESHOLD = 0.6
+# Query skills are embedded this many at a time to bound memory for large pools
+SEARCH_BATCH = 1024
+
+
+def normalize_skill(skill: str) -> str:
+    """Lowercase and drop punctuation/spacing differences ('Node.js' -> 'nodejs')."""
+    return re.sub(r"[^a-z0-9+#]", "", skill.lower())
+
+
+class SkillEncoder(Protocol):
+    def fit(self, skills: list[str]) -> "SkillEncoder": ...
+    def encode(self, skills: list[str]) -> np.ndarray: ...
+
+
+class HashingSkillEncoder:
+    """Character n-gram hashing vectors; stateless and fully offline (the default)."""
+
+    def __init__(self, n_features: int = 2 ** 12):
+        self.vectorizer = HashingVectorizer(
+            analyzer="char_wb", ngram_range=(2, 4), n_features=n_features,
+            alternate_sign=False, norm="l2",
+        )
+
+    def fit(self, skills: list[str]) -> "HashingSkillEncoder":
+        return self
+
+    def encode(self, skills: list[str]) -> np.ndarray:
+        return self.vectorizer.transform([normalize_skill(s) for s in skills]).toarray().astype(np.float32)
+
+
+class TfidfSkillEncoder:
+    """Character n-gram TF-IDF vectors fitted on the skill vocabulary."""
+
+    def __init__(self):
+        self.vectorizer = TfidfVectorizer(analyzer="char_wb", ngram_range=(2, 4))
+
+    def fit(self, skills: list[str]) -> "TfidfSkillEncoder":
+        self.vectorizer.fit([normalize_skill(s) for s in skills])
+        return self
+
+    def encode(self, skills: list[str]) -> np.ndarray:
+        return self.vectorizer.transform([normalize_skill(s) for s in skills]).toarray().astype(np.float32)
+
+
+class SkillIndex:
+    """
+        Nearest-neighbour index over a skill vocabulary.
+
+        Vocabulary vectors are computed once; lookups embed all query skills
+        together and resolve them with a single batched inner-product search
+        (FAISS when installed), instead of comparing every pair of strings.
+    """
+
+    def __init__(self, vocabulary: list[str], encoder: Optional[SkillEncoder] = None,
+                 threshold: float = DEFAULT_THRESHOLD):
+        self.vocabulary = list(dict.fromkeys(vocabulary))
+        self.encoder = (encoder or HashingSkillEncoder()).fit(self.vocabulary)
+        self.threshold = threshold
+        self.vectors = self.encoder.encode(self.vocabulary) if self.vocabulary else None
+
+        self._index = None
+        if faiss is not None and self.vectors is not None:
+            self._index = faiss.IndexFlatIP(self.vectors.shape[1])
+            self._index.add(self.vectors)
+
+    def search(self, skills: list[str]) -> tuple[np.ndarray, np.ndarray]:
+        """Best vocabulary position and cosine similarity for every query skill."""
+        if not skills or self.vectors is None:
+            return np.full(len(skills), -1), np.zeros(len(skills), dtype=np.float32)
+
+        positions, similarities = [], []
+        for start in range(0, len(skills), SEARCH_BATCH):
+            queries = self.encoder.encode(skills[start:start + SEARCH_BATCH])
+            if self._index is not None:
+                similarity, position = self._index.search(queries, 1)
+                positions.append(position[:, 0])
+                similarities.append(similarity[:, 0])
+            else:
+                scores = queries @ self.vectors.T
+                position = scores.argmax(axis=1)
+                positions.append(position)
+                similarities.append(scores[np.arange(len(position)), position])
+        return np.concatenate(positions), np.concatenate(similarities)
+
+    def lookup(self, skills: list[str]) -> list[Optional[str]]:
+        """Closest vocabulary skill for each query, or None when nothing is similar enough."""
+        positions, similarity = self.search(skills)
+        return [
+            self.vocabulary[p] if p >= 0 and s >= self.threshold else None
+            for p, s in zip(positions, similarity)
+        ]
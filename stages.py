@@ -0,0 +1,65 @@
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, Callable, Iterator, Optional
+
+
+class StageExecutor:
+    """
+        Run named stages on a thread pool as soon as their dependencies finish.
+
+        Each stage function receives the results of its dependencies as
+        positional arguments, in the order they were declared. A stage whose
+        dependency failed is not run and is reported with that failure.
+    """
+
+    def __init__(self, max_workers: int = 4, initializer: Optional[Callable[[], None]] = None):
+        self.max_workers = max_workers
+        self.initializer = initializer
+        self._stages: dict[str, tuple[Callable[..., Any], tuple[str, ...]]] = {}
+
+    def add(self, name: str, fn: Callable[..., Any], deps: tuple[str, ...] = ()) -> "StageExecutor":
+        for dep in deps:
+            if dep not in self._stages:
+                raise ValueError(f"Stage '{name}' depends on unknown stage '{dep}'")
+        self._stages[name] = (fn, tuple(deps))
+        return self
+
+    def run(self, poll: Optional[Callable[[], None]] = None,
+            poll_interval: float = 0.1) -> Iterator[tuple[str, Any, Optional[BaseException]]]:
+        """
+            Yield (name, result, error) for each stage as it completes.
+
+            `poll` is called on the calling thread every `poll_interval` seconds
+            while stages are running (e.g. to drain streamed output into the UI).
+        """
+        results: dict[str, Any] = {}
+        failed: dict[str, BaseException] = {}
+        waiting = dict(self._stages)
+        running = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, initializer=self.initializer) as executor:
+            while waiting or running:
+                for name, (fn, deps) in list(waiting.items()):
+                    failed_dep = next((dep for dep in deps if dep in failed), None)
+                    if failed_dep is not None:
+                        del waiting[name]
+                        failed[name] = RuntimeError(f"Skipped because '{failed_dep}' failed: {failed[failed_dep]}")
+                        yield name, None, failed[name]
+                    elif all(dep in results for dep in deps):
+                        del waiting[name]
+                        running[executor.submit(fn, *(results[dep] for dep in deps))] = name
+
+                if not running:
+                    continue
+
+                done, _ = wait(running, timeout=poll_interval if poll else None, return_when=FIRST_COMPLETED)
+                if poll:
+                    poll()
+
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        results[name] = future.result()
+                        yield name, results[name], None
+                    except Exception as e:
+                        failed[name] = e
+                        yield name, None, e
@@ -0,0 +1,79 @@
+"""
+        Pooled Groq clients reuse one keep-alive connection across calls
+
+        Runs against the local stand-in server from benchmarks/fake_groq.py,
+        so no Groq key or network access is needed.
+"""
+
+import os
+import sys
+import threading
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+import llm_clients
+from fake_groq import FakeGroqServer, FakeGroqSettings
+
+
+class CountingServer(FakeGroqServer):
+    """Fake Groq server that counts the TCP connections it accepts."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.connections = 0
+
+    def get_request(self):
+        request = super().get_request()
+        with self._lock:
+            self.connections += 1
+        return request
+
+
+@pytest.fixture
+def server(monkeypatch):
+    server = CountingServer(("127.0.0.1", 0), FakeGroqSettings(latency=0.0))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setenv("GROQ_BASE_URL", server.url)
+    # Start from an empty pool so earlier tests cannot lend us a warm connection
+    monkeypatch.setattr(llm_clients, "_http_client", None)
+    monkeypatch.setattr(llm_clients, "_groq_clients", {})
+    monkeypatch.setattr(llm_clients, "_chat_models", {})
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_groq_client_reuses_connection(server):
+    for _ in range(2):
+        # Looked up again each time, like every engine and rerun does
+        client = llm_clients.get_groq_client("fake-key")
+        client.chat.completions.create(
+            messages=[{"role": "user", "content": "hello"}], model="llama3-8b-8192",
+        )
+
+    assert llm_clients.get_groq_client("fake-key") is client
+    assert server.requests == 2
+    assert server.connections == 1
+
+
+def test_chat_groq_reuses_connection(server):
+    for _ in range(2):
+        llm = llm_clients.get_chat_groq("fake-key", model_name="llama3-8b-8192", temperature=0.7)
+        llm.invoke("hello")
+
+    assert server.requests == 2
+    assert server.connections == 1
+
+
+def test_raw_and_langchain_clients_share_the_pool(server):
+    llm_clients.get_groq_client("fake-key").chat.completions.create(
+        messages=[{"role": "user", "content": "hello"}], model="llama3-8b-8192",
+    )
+    llm_clients.get_chat_groq("fake-key", model_name="llama3-8b-8192", temperature=0.7).invoke("hello")
+
+    assert server.requests == 2
+    assert server.connections == 1